@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import copy
 import csv
+import errno
+import functools
 import hashlib
 import html
 import json
@@ -18,6 +20,7 @@ import re
 import shutil
 import sqlite3
 import sys
+import threading
 
 # Load environment variables from .env file if python-dotenv is available
 if os.path.exists(".env"):
@@ -30,9 +33,24 @@ if os.path.exists(".env"):
         pass
 import textwrap
 import time
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, cast
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    cast,
+)
 
 import click
 
@@ -44,6 +62,16 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - fallback loader
     yaml = None
 
+try:  # pragma: no cover - optional fast JSON codec
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional streaming JSON parser
+    import ijson
+except ModuleNotFoundError:
+    ijson = None
+
 try:  # pragma: no cover - optional rich styling for CLI feedback
     from rich.console import Console  # type: ignore # noqa: F401
     from rich.table import Table  # type: ignore # noqa: F401
@@ -69,6 +97,14 @@ DEFAULT_PROJECTS_EMIT = SAFE_DIR / "projects.json"
 DEFAULT_JOURNAL = SAFE_DIR / "journal.jsonl"
 DEFAULT_SAFE_MAP = SAFE_DIR / "safe_map.json"
 CACHE_DB_PATH = SAFE_DIR / "scan_cache.sqlite3"
+# 이 문서 수 이상이면 어휘 사전 없이 해시 특징으로 TF-IDF를 만든다.
+HASHING_MIN_DOCS = 2000
+HASHING_FEATURES = 2**15
+# 군집화 문서에 포함할 샘플 최대 길이(기본 --sample-bytes와 동일)
+CLUSTER_SAMPLE_CHARS = 4096
+# 해시: 이 크기 이상은 mmap, 그 이상 큰 파일은 BLAKE3 다중 스레드 모드
+MMAP_HASH_MIN_BYTES = 64 * 1024
+THREADED_HASH_MIN_BYTES = 1024 * 1024
 
 SCHEMA_FALLBACK = {
     "target_root": "C:/PROJECTS_STRUCT",
@@ -205,6 +241,27 @@ SKIP_LABEL_SEGMENTS = {
 }
 
 
+_SIZE_RE = re.compile(r"^(\d+)(B|KB|MB|GB)?$")
+_SANITIZE_RE = re.compile(r"[A-Za-z]:\\[^\\]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_HEADING_RE = re.compile(r"^[^\S\n]*(#{1,3})[^\S\n]+(\S.*)$", re.MULTILINE)
+_IMPORT_RE = re.compile(r"^[^\S\n]*(?:import|from) [^\S\n]*(?=\S),*([^\s,]*)", re.MULTILINE)
+_LABEL_RE = re.compile(r"[^a-z0-9]+")
+# (가드 리터럴, 패턴, 치환) — 가드가 없으면 정규식 패스를 생략한다.
+# (guard literal, pattern, replacement) — skip the regex pass when the guard is absent.
+_MASK_PATTERNS = tuple(
+    (guard, re.compile(pattern), repl)
+    for guard, pattern, repl in (
+        ("@", r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+", "<EMAIL>"),
+        ("-", r"\b\d{3}-\d{2}-\d{4}\b", "<SSN>"),
+        ("", r"\b\d{6,}\b", "<NUM>"),
+        ("aws_", r"(aws_secret_access_key|aws_access_key_id)\s*=\s*[^\s]+", r"\1=<REDACTED>"),
+        ("", r"(?i)api[_-]?key\s*[:=]\s*[^\s]+", "API_KEY=<REDACTED>"),
+        (":\\", r"[A-Za-z]:\\[^\n]+", "<PATH>"),
+    )
+)
+
+
 def ensure_cache_dir() -> None:
     """KR: .cache 디렉토리를 만든다. EN: Ensure cache directory exists."""
 
@@ -217,7 +274,7 @@ def parse_size_limit(limit: Optional[str]) -> Optional[int]:
     if not limit:
         return None
     token = limit.strip().upper()
-    m = re.match(r"^(\d+)(B|KB|MB|GB)?$", token)
+    m = _SIZE_RE.match(token)
     if not m:
         raise click.BadParameter("--max-size expects numbers like 500MB or 1024KB")
     value = int(m.group(1))
@@ -235,58 +292,91 @@ def sanitize_path(path: str) -> str:
     """KR: 민감 경로를 마스킹한다. EN: Mask sensitive absolute paths."""
 
     path = path.replace("/", "\\")
-    return re.sub(r"[A-Za-z]:\\[^\\]+", "<PATH>", path)
+    # 드라이브 접두(X:\) 가 없으면 정규식 엔진 호출 생략
+    if ":\\" not in path:
+        return path
+    return _SANITIZE_RE.sub("<PATH>", path)
 
 
 def mask_sensitive_text(text: str) -> str:
     """KR: PII/시크릿을 마스킹한다. EN: Mask PII and secrets from samples."""
 
-    patterns = [
-        (r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+", "<EMAIL>"),
-        (r"\b\d{3}-\d{2}-\d{4}\b", "<SSN>"),
-        (r"\b\d{6,}\b", "<NUM>"),
-        (r"(aws_secret_access_key|aws_access_key_id)\s*=\s*[^\s]+", r"\1=<REDACTED>"),
-        (r"(?i)api[_-]?key\s*[:=]\s*[^\s]+", "API_KEY=<REDACTED>"),
-        (r"[A-Za-z]:\\[^\n]+", "<PATH>"),
-    ]
     masked = text
-    for pat, repl in patterns:
-        masked = re.sub(pat, repl, masked)
+    for guard, pattern, repl in _MASK_PATTERNS:
+        if guard in masked:
+            masked = pattern.sub(repl, masked)
     return masked
 
 
+HASH_CHUNK_BYTES = 4 * 1024 * 1024
+_HASH_BUFFERS = threading.local()
+
+
+def _hash_view() -> memoryview:
+    """KR: 스레드별 재사용 해시 버퍼. EN: Per-thread reusable hashing buffer."""
+
+    view = getattr(_HASH_BUFFERS, "view", None)
+    if view is None:
+        view = memoryview(bytearray(HASH_CHUNK_BYTES))
+        _HASH_BUFFERS.view = view
+    return cast(memoryview, view)
+
+
+def _update_from_file(hasher: Any, path: Path) -> None:
+    """KR: 버퍼에 readinto 하며 해시를 갱신. EN: Feed file into hasher via readinto."""
+
+    view = _hash_view()
+    with path.open("rb", buffering=0) as handle:
+        while True:
+            read = handle.readinto(view)
+            if not read:
+                break
+            hasher.update(view[:read])
+
+
 def compute_blake7(path: Path) -> str:
-    """KR: BLAKE3 7자 해시를 계산한다. EN: Compute seven-char BLAKE3 hash."""
+    """KR: BLAKE3 7자 해시를 계산한다(64KiB 이상은 mmap, 1MiB 이상은 다중 스레드).
+    EN: Compute seven-char BLAKE3 hash; mmap from 64KiB, multi-threaded from 1MiB."""
 
+    hasher: Any  # blake3 또는 폴백 blake2b
     try:
         import blake3
-
-        hasher = blake3.blake3()
-        with path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-                hasher.update(chunk)
-        return str(hasher.hexdigest()[:7])
     except ModuleNotFoundError:  # pragma: no cover - fallback path
         hasher = hashlib.blake2b(digest_size=16)
-        with path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-                hasher.update(chunk)
+        _update_from_file(hasher, path)
         return str(hasher.hexdigest()[:7])
 
+    size = path.stat().st_size
+    if size < MMAP_HASH_MIN_BYTES:
+        # 작은 파일은 mmap 설정 비용이 해시 비용보다 크다
+        hasher = blake3.blake3()
+        _update_from_file(hasher, path)
+    else:
+        # update_mmap 은 GIL 을 풀고 SIMD 로 해시, 큰 파일은 내부 스레드 풀까지 사용
+        threads = blake3.blake3.AUTO if size >= THREADED_HASH_MIN_BYTES else 1
+        hasher = blake3.blake3(max_threads=threads)
+        hasher.update_mmap(path)
+    return str(hasher.hexdigest()[:7])
+
 
-def sha256_string(value: str) -> str:
-    """KR: 문자열 SHA256. EN: SHA256 hash of string."""
+def safe_id_for(path: str) -> str:
+    """KR: 경로용 128비트 safe_id(보안 경계 아님).
+    EN: 128-bit safe_id for a path; a map key, not a security boundary."""
 
-    digest = hashlib.sha256()
-    digest.update(value.encode("utf-8", errors="ignore"))
-    return digest.hexdigest()
+    return hashlib.blake2b(path.encode("utf-8", errors="ignore"), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=512)
+def _mime_for_ext(ext: str) -> str:
+    mime, _ = mimetypes.guess_type("x" + ext)
+    return mime or "application/octet-stream"
 
 
 def infer_mimetype(path: Path) -> str:
     """KR: 마임타입 추론. EN: Infer mimetype for file."""
 
-    mime, _ = mimetypes.guess_type(path.name)
-    return mime or "application/octet-stream"
+    # 압축 확장자(.tar.gz 등)와 대소문자 규칙을 보존하도록 마지막 두 확장자 원문으로 캐시
+    return _mime_for_ext("".join(path.suffixes[-2:]))
 
 
 def dir_hint(path: Path) -> str:
@@ -299,12 +389,10 @@ def dir_hint(path: Path) -> str:
 def extract_imports(sample_text: str) -> List[str]:
     """KR: 파이썬 import 키워드를 추출. EN: Extract Python imports from text."""
 
+    # 줄 목록을 만들지 않고 정규식 한 번으로 훑다가 8개에서 멈춘다
     imports: List[str] = []
-    for line in sample_text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("import ") or stripped.startswith("from "):
-            token = re.split(r"\s+", stripped)[1]
-            imports.append(token.replace(",", "").strip())
+    for match in _IMPORT_RE.finditer(sample_text):
+        imports.append(match.group(1))
         if len(imports) >= 8:
             break
     return imports
@@ -331,10 +419,8 @@ def extract_markdown_headings(sample_text: str) -> List[str]:
     """KR: Markdown H1~H3 제목 추출. EN: Extract markdown headings (H1-H3)."""
 
     headings: List[str] = []
-    for line in sample_text.splitlines():
-        match = re.match(r"^(#{1,3})\s+(.*)$", line.strip())
-        if match:
-            headings.append(match.group(2).strip())
+    for match in _HEADING_RE.finditer(sample_text):
+        headings.append(match.group(2).strip())
         if len(headings) >= 5:
             break
     return headings
@@ -346,12 +432,16 @@ def extract_json_keys(path: Path, limit_bytes: int = 512 * 1024) -> List[str]:
     if path.suffix.lower() != ".json":
         return []
     try:
-        data = path.read_bytes()
+        # 한도 초과 파일은 읽기 전에 stat으로 걸러낸다
+        if path.stat().st_size > limit_bytes:
+            return []
+        with path.open("rb") as handle:
+            data = handle.read(limit_bytes + 1)
         if len(data) > limit_bytes:
             return []
         obj = json.loads(data.decode("utf-8", errors="ignore"))
         if isinstance(obj, dict):
-            return list(obj.keys())[:20]
+            return list(islice(obj, 20))
     except Exception:  # pragma: no cover - invalid JSON
         return []
     return []
@@ -413,62 +503,201 @@ def record_from_entry(entry: Dict[str, Any]) -> DocumentRecord:
     return DocumentRecord.model_validate(entry)
 
 
-class ScanCache:
-    """KR: 스캔 캐시(SQLite). EN: SQLite-backed scan cache."""
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """KR: orjson 우선 JSON 직렬화. EN: Serialize JSON, preferring orjson."""
 
-    def __init__(self, db_path: Path) -> None:
-        ensure_cache_dir()
-        # SQLite 잠금 문제 해결: WAL 모드 + timeout + busy_timeout
-        self.conn = sqlite3.connect(str(db_path), timeout=30.0)
-        cur = self.conn.cursor()
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
 
-        # WAL 모드 설정: 읽기(다수) + 쓰기(1) 동시 허용, 잠금 충돌 감소
-        cur.execute("PRAGMA journal_mode=WAL;")
 
-        # Busy 핸들러: 잠금 시 재시도 대기 (5초)
-        cur.execute("PRAGMA busy_timeout=5000;")
+def json_bytes(obj: Any) -> bytes:
+    """KR: 한 줄 JSON 바이트 직렬화. EN: Serialize compact JSON straight to bytes."""
 
-        # fsync 강도 조절로 성능/안정 타협
-        cur.execute("PRAGMA synchronous=NORMAL;")
+    if orjson is not None:
+        return bytes(orjson.dumps(obj))
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
-        # 테이블 생성
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS records (
-                safe_id TEXT PRIMARY KEY,
-                path TEXT NOT NULL,
-                size INTEGER NOT NULL,
-                mtime REAL NOT NULL,
-                payload TEXT NOT NULL
-            )
-            """
+
+def json_loads(data: str | bytes) -> Any:
+    """KR: orjson 우선 JSON 파싱. EN: Parse JSON, preferring orjson."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json_file(path: str | Path) -> Any:
+    """KR: JSON 파일 로드. EN: Load a JSON file."""
+
+    return json_loads(Path(path).read_bytes())
+
+
+def iter_json_items(path: str | Path, prefix: str) -> Iterator[Any]:
+    """KR: JSON 배열 항목 스트리밍(ijson 없으면 전체 로드). EN: Stream array items under `prefix`.
+
+    `prefix` uses ijson syntax, e.g. ``"projects.item"``; without ijson the
+    whole document is parsed once and the same items are yielded."""
+
+    if ijson is not None:
+        with Path(path).open("rb") as handle:
+            yield from ijson.items(handle, prefix, use_float=True)
+        return
+    data = read_json_file(path)
+    for key in prefix.split(".")[:-1]:
+        data = data.get(key, []) if isinstance(data, dict) else []
+    yield from data
+
+
+def write_json_file(path: str | Path, data: Any) -> None:
+    """KR: 들여쓰기 JSON 파일 저장(orjson 우선). EN: Write indented JSON, preferring orjson."""
+
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        Path(path).write_bytes(orjson.dumps(data, option=option))
+        return
+    Path(path).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def read_safe_map(path: str | Path) -> Dict[str, str]:
+    """KR: safe_map 로드. EN: Load the safe_id → path map."""
+
+    return cast(Dict[str, str], read_json_file(path))
+
+
+def write_safe_map(path: str | Path, safe_map: Dict[str, str]) -> None:
+    """KR: safe_map 저장. EN: Persist the safe_id → path map."""
+
+    write_json_file(path, safe_map)
+
+
+_SELECT_META_SQL = "SELECT mtime, size, payload FROM records WHERE safe_id = ?"
+_REPLACE_RECORD_SQL = (
+    "REPLACE INTO records (safe_id, path, size, mtime, payload) VALUES (?,?,?,?,?)"
+)
+
+
+def _cache_row(record: DocumentRecord) -> tuple[str, str, int, float, str]:
+    """KR: 캐시 행 튜플 생성. EN: Build the cache row tuple for a record."""
+
+    payload = json_dumps(record.to_json())
+    return (record.safe_id, record.path, record.size, record.mtime, payload)
+
+
+_CONN_LOCAL = threading.local()
+_CONN_REGISTRY: List[sqlite3.Connection] = []
+_CONN_LOCK = threading.Lock()
+_CONN_GENERATION = 0
+
+
+def _cache_connection(db_path: Path) -> sqlite3.Connection:
+    """KR: 스레드·DB 경로별 공유 연결(최초 1회만 PRAGMA·스키마 설정).
+    EN: Per-thread, per-path shared connection; PRAGMAs and schema run only once."""
+
+    key = db_path.resolve()
+    # close_cache_connections 이후에는 스레드별 캐시를 새로 시작
+    if getattr(_CONN_LOCAL, "generation", None) != _CONN_GENERATION:
+        _CONN_LOCAL.conns = {}
+        _CONN_LOCAL.generation = _CONN_GENERATION
+    conns = cast(Dict[Path, sqlite3.Connection], _CONN_LOCAL.conns)
+    conn = conns.get(key)
+    if conn is not None:
+        return conn
+    # SQLite 잠금 문제 해결: WAL 모드 + timeout + busy_timeout
+    # (다른 스레드에서 close_cache_connections로 닫을 수 있도록 check_same_thread=False)
+    conn = sqlite3.connect(str(db_path), timeout=30.0, check_same_thread=False)
+    cur = conn.cursor()
+
+    # WAL 모드 설정: 읽기(다수) + 쓰기(1) 동시 허용, 잠금 충돌 감소
+    cur.execute("PRAGMA journal_mode=WAL;")
+
+    # Busy 핸들러: 잠금 시 재시도 대기 (5초)
+    cur.execute("PRAGMA busy_timeout=5000;")
+
+    # fsync 강도 조절로 성능/안정 타협
+    cur.execute("PRAGMA synchronous=NORMAL;")
+
+    # 페이지 캐시 64MiB: 대량 스캔 중 자주 쓰는 페이지를 메모리에 유지
+    cur.execute("PRAGMA cache_size=-65536;")
+
+    # 테이블 생성
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS records (
+            safe_id TEXT PRIMARY KEY,
+            path TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime REAL NOT NULL,
+            payload TEXT NOT NULL
         )
-        self.conn.commit()
+        """
+    )
+    conn.commit()
+    conns[key] = conn
+    with _CONN_LOCK:
+        _CONN_REGISTRY.append(conn)
+    return conn
+
+
+def close_cache_connections() -> None:
+    """KR: 모든 스레드의 캐시 연결을 커밋 후 닫는다.
+    EN: Commit and close every thread's cache connection."""
+
+    global _CONN_GENERATION
+    with _CONN_LOCK:
+        for conn in _CONN_REGISTRY:
+            conn.commit()
+            conn.close()
+        _CONN_REGISTRY.clear()
+        _CONN_GENERATION += 1
+
+
+class ScanCache:
+    """KR: 스캔 캐시(SQLite). EN: SQLite-backed scan cache."""
+
+    def __init__(self, db_path: Path, batch_size: int = 500) -> None:
+        ensure_cache_dir()
+        # 커밋을 묶어 행마다 발생하는 WAL flush를 줄인다
+        self._pending = 0
+        self._batch = batch_size
+        self.conn: Optional[sqlite3.Connection] = _cache_connection(Path(db_path))
+        self._cursor = self.conn.cursor()
+
+    def load_meta(self, safe_id: str) -> Optional[tuple[float, int, str]]:
+        """KR: (mtime, size, payload) 원문 조회. EN: Fetch raw (mtime, size, payload) row."""
+
+        row = self._cursor.execute(_SELECT_META_SQL, (safe_id,)).fetchone()
+        return cast(Optional[tuple[float, int, str]], row)
 
     def load(self, safe_id: str, mtime: float, size: int) -> Optional[Dict[str, Any]]:
-        cur = self.conn.execute(
-            "SELECT payload FROM records WHERE safe_id = ? AND mtime = ? AND size = ?",
-            (safe_id, mtime, size),
-        )
-        row = cur.fetchone()
-        if row:
-            try:
-                return cast(Dict[str, Any], json.loads(row[0]))
-            except json.JSONDecodeError:  # pragma: no cover
-                return None
-        return None
+        meta = self.load_meta(safe_id)
+        # 메타데이터가 다르면 JSON 파싱 없이 미스로 처리
+        if meta is None or meta[0] != mtime or meta[1] != size:
+            return None
+        try:
+            return cast(Dict[str, Any], json_loads(meta[2]))
+        except json.JSONDecodeError:  # pragma: no cover
+            return None
 
     def save(self, record: DocumentRecord) -> None:
-        payload = json.dumps(record.to_json(), ensure_ascii=False)
-        self.conn.execute(
-            "REPLACE INTO records (safe_id, path, size, mtime, payload) VALUES (?,?,?,?,?)",
-            (record.safe_id, record.path, record.size, record.mtime, payload),
-        )
-        self.conn.commit()
+        self.conn.execute(_REPLACE_RECORD_SQL, _cache_row(record))
+        self._pending += 1
+        if self._pending >= self._batch:
+            self.flush()
+
+    def flush(self) -> None:
+        """KR: 대기 중인 쓰기를 커밋한다. EN: Commit pending writes."""
+
+        if self._pending:
+            self.conn.commit()
+            self._pending = 0
 
     def close(self) -> None:
-        if self.conn:
-            self.conn.close()
+        # 연결은 공유되므로 닫지 않고 대기 중인 쓰기만 커밋한다
+        if self.conn is not None:
+            self.flush()
+            self.conn = None
 
     def __enter__(self):
         return self
@@ -476,9 +705,6 @@ class ScanCache:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
-    def __del__(self):
-        self.close()
-
 
 # ---------------------------------------------------------------------------
 # Rule engine
@@ -507,12 +733,141 @@ class RuleWeights(LogiBaseModel):
     mimetype: float = 1.0
 
 
+class _RecordCtx(NamedTuple):
+    """KR: 분류용 소문자 필드 묶음. EN: Lower-cased record fields for scoring."""
+
+    ext_lower: str
+    name_lower: str
+    path_lower: str
+    dir_hint: str
+    headings_lower: str
+    imports_lower: List[str]
+    sample_lower: str
+    mime_lower: str
+
+    @classmethod
+    def from_record(cls, record: DocumentRecord) -> "_RecordCtx":
+        return cls(
+            ext_lower=record.ext.lower(),
+            name_lower=record.name.lower(),
+            path_lower=record.path.lower(),
+            dir_hint=record.dir_hint,
+            headings_lower=" ".join(record.md_headings).lower(),
+            imports_lower=[imp.lower() for imp in record.imports],
+            sample_lower=record.sample.lower(),
+            mime_lower=record.mimetype.lower(),
+        )
+
+
+def record_columns(records: Sequence[DocumentRecord]) -> Dict[str, List[Any]]:
+    """KR: 레코드 배치를 필드별 리스트(SoA)로 변환.
+    EN: Convert a record batch into per-field lists (struct of arrays)."""
+
+    return {
+        "ext_lower": [record.ext.lower() for record in records],
+        "name_lower": [record.name.lower() for record in records],
+        "path_lower": [record.path.lower() for record in records],
+        "dir_hint": [record.dir_hint for record in records],
+        "headings_lower": [" ".join(record.md_headings).lower() for record in records],
+        "imports_lower": [[imp.lower() for imp in record.imports] for record in records],
+        "sample_lower": [record.sample.lower() for record in records],
+        "mime_lower": [record.mimetype.lower() for record in records],
+    }
+
+
 class RuleEngine:
     """KR: 규칙 기반 버킷 분류기. EN: Rule-based bucket classifier."""
 
     def __init__(self, buckets: List[RuleBucket], weights: RuleWeights) -> None:
         self.buckets = buckets
         self.weights = weights
+        # 키워드 → (버킷 인덱스, 가중치) 역색인: 키워드당 한 번만 검사
+        self._ext_index = self._keyword_index("exts", weights.name, unique=True)
+        self._name_index = self._keyword_index("name_keywords", weights.name)
+        self._dir_index = self._keyword_index("dir_keywords", weights.dir)
+        self._title_index = self._keyword_index("title_keywords", weights.content)
+        self._import_index = self._keyword_index("imports", weights.content)
+        self._hint_index = self._keyword_index("code_hints", weights.content)
+        self._mime_index = self._keyword_index("mimetypes", weights.mimetype)
+        self._decisive_ext = self._decisive_extensions()
+        self._score = self._compile_scorer()
+
+    def _keyword_index(
+        self, field: str, weight: float, unique: bool = False
+    ) -> Dict[str, List[tuple[int, float]]]:
+        """KR: 필드별 키워드 역색인 생성. EN: Build keyword → bucket index for a field."""
+
+        index: Dict[str, List[tuple[int, float]]] = defaultdict(list)
+        for position, bucket in enumerate(self.buckets):
+            keywords = getattr(bucket, field)
+            # 확장자는 포함 여부만 보므로 버킷당 한 번만 가산
+            for keyword in dict.fromkeys(keywords) if unique else keywords:
+                index[keyword].append((position, weight))
+        return dict(index)
+
+    def _ceiling(self, bucket: RuleBucket) -> float:
+        """KR: 확장자 외 필드로 얻을 수 있는 최대 점수. EN: Best non-extension score."""
+
+        weights = self.weights
+        return (
+            len(bucket.name_keywords) * weights.name
+            + len(bucket.dir_keywords) * weights.dir
+            + (len(bucket.title_keywords) + len(bucket.imports) + len(bucket.code_hints))
+            * weights.content
+            + len(bucket.mimetypes) * weights.mimetype
+        )
+
+    def _decisive_extensions(self) -> Dict[str, str]:
+        """KR: 다른 버킷이 절대 넘을 수 없는 확장자 → 버킷.
+        EN: Extensions whose bucket no other bucket can ever outscore."""
+
+        decisive: Dict[str, str] = {}
+        ceilings = [self._ceiling(bucket) for bucket in self.buckets]
+        for ext, targets in self._ext_index.items():
+            if len(targets) != 1:
+                continue
+            position, weight = targets[0]
+            rivals = (c for i, c in enumerate(ceilings) if i != position)
+            # 동점이면 버킷 이름 순서가 승자를 정하므로 엄격히 커야 한다
+            if weight > 0 and all(weight > ceiling for ceiling in rivals):
+                decisive[ext] = self.buckets[position].name
+        return decisive
+
+    def _compile_scorer(self) -> Callable[[_RecordCtx], List[float]]:
+        """KR: 현재 규칙을 상수로 박아 넣은 점수 함수를 생성한다.
+        EN: Generate a scoring function with this rule set baked in as literals."""
+
+        lines = [
+            "def _score(ctx):",
+            f"    s = [0.0] * {len(self.buckets)}",
+            # 확장자는 정확 일치이므로 사전 조회 한 번
+            "    for p, w in EXT.get(ctx.ext_lower, ()):",
+            "        s[p] += w",
+            "    imports = set(ctx.imports_lower)",
+            "    name = ctx.name_lower",
+            "    headings = ctx.headings_lower",
+            "    sample = ctx.sample_lower",
+            "    mime = ctx.mime_lower",
+            "    path = ctx.path_lower",
+            "    hint = ctx.dir_hint",
+        ]
+
+        def emit(index: Dict[str, List[tuple[int, float]]], test: str) -> None:
+            for keyword, targets in index.items():
+                lines.append(f"    if {test.format(kw=repr(keyword))}:")
+                lines.extend(f"        s[{position}] += {weight!r}" for position, weight in targets)
+
+        emit(self._import_index, "{kw} in imports")
+        emit(self._name_index, "{kw} in name")
+        emit(self._title_index, "{kw} in headings")
+        emit(self._hint_index, "{kw} in sample")
+        emit(self._mime_index, "{kw} in mime")
+        emit(self._dir_index, "{kw} in path or (hint and {kw} in hint)")
+        lines.append("    return s")
+
+        namespace: Dict[str, Any] = {"EXT": self._ext_index}
+        exec(compile("\n".join(lines), "<rule-engine>", "exec"), namespace)
+        return cast(Callable[[_RecordCtx], List[float]], namespace["_score"])
 
     @staticmethod
     def from_config(path: Optional[Path]) -> "RuleEngine":
@@ -552,58 +907,27 @@ class RuleEngine:
         weights = RuleWeights(**weights_data)
         return RuleEngine(buckets, weights)
 
-    def score_bucket(self, record: DocumentRecord, bucket: RuleBucket) -> float:
-        name_lower = record.name.lower()
-        path_lower = record.path.lower()
-        sample_lower = record.sample.lower()
-        score = 0.0
-
-        if bucket.exts and record.ext.lower() in bucket.exts:
-            score += self.weights.name
-
-        if bucket.name_keywords:
-            for keyword in bucket.name_keywords:
-                if keyword in name_lower:
-                    score += self.weights.name
-
-        if bucket.dir_keywords:
-            for keyword in bucket.dir_keywords:
-                if keyword in path_lower or (
-                    record.dir_hint and keyword in record.dir_hint
-                ):
-                    score += self.weights.dir
-
-        if bucket.title_keywords:
-            joined = " ".join(record.md_headings).lower()
-            for keyword in bucket.title_keywords:
-                if keyword in joined:
-                    score += self.weights.content
-
-        if bucket.imports:
-            imports_lower = [imp.lower() for imp in record.imports]
-            for keyword in bucket.imports:
-                if keyword in imports_lower:
-                    score += self.weights.content
-
-        if bucket.code_hints:
-            for keyword in bucket.code_hints:
-                if keyword in sample_lower:
-                    score += self.weights.content
-
-        if bucket.mimetypes:
-            for mime in bucket.mimetypes:
-                if mime in record.mimetype.lower():
-                    score += self.weights.mimetype
-
-        return score
-
     def classify(self, record: DocumentRecord) -> str:
-        scores = []
-        for bucket in self.buckets:
-            score = self.score_bucket(record, bucket)
-            scores.append((score, bucket.name))
-        scores.sort(reverse=True)
-        top_score, top_bucket = scores[0]
+        decisive = self._decisive_ext.get(record.ext.lower())
+        if decisive is not None:
+            return decisive
+        # 레코드 필드 소문자화를 버킷마다가 아니라 한 번만 수행
+        return self._classify_ctx(_RecordCtx.from_record(record))
+
+    def classify_all(self, batch: Dict[str, List[Any]]) -> List[str]:
+        """KR: SoA 배치 일괄 분류. EN: Classify a struct-of-arrays batch."""
+
+        decisive = self._decisive_ext
+        results: List[str] = []
+        columns = (batch[field] for field in _RecordCtx._fields)
+        for ctx in map(_RecordCtx._make, zip(*columns)):
+            bucket = decisive.get(ctx.ext_lower)
+            results.append(bucket if bucket is not None else self._classify_ctx(ctx))
+        return results
+
+    def _classify_ctx(self, ctx: _RecordCtx) -> str:
+        scores = self._score(ctx)
+        top_score, top_bucket = max(zip(scores, (bucket.name for bucket in self.buckets)))
         if top_score <= 0:
             return "tmp"
         return top_bucket
@@ -617,24 +941,19 @@ class RuleEngine:
 def normalize_label(label: str) -> str:
     """KR: 프로젝트 라벨 정규화. EN: Normalize project labels."""
 
-    cleaned = re.sub(r"[^a-z0-9]+", "_", label.lower()).strip("_")
+    cleaned = _LABEL_RE.sub("_", label.lower()).strip("_")
     return cleaned or "misc"
 
 
 def split_path_segments(path: str) -> List[str]:
     """경로를 세그먼트로 분리한다. Split a filesystem-like path into segments."""
 
-    tokens = re.split(r"[\\/]+", path)
+    # [\\/]+ 분할은 구분자 통일 후 split + 빈 토큰 제거와 같다 → 정규식 불필요
     segments: List[str] = []
-    for token in tokens:
+    for token in path.replace("\\", "/").split("/"):
         candidate = token.strip()
-        if not candidate:
-            continue
-        if candidate.endswith(":"):
-            continue
-        if candidate in {"."}:
-            continue
-        segments.append(candidate)
+        if candidate and candidate != "." and not candidate.endswith(":"):
+            segments.append(candidate)
     return segments
 
 
@@ -646,7 +965,8 @@ def longest_common_prefix(segments: List[List[str]]) -> List[str]:
     prefix: List[str] = []
     for group in zip(*segments):
         first = group[0]
-        if all(item == first for item in group[1:]):
+        # C 수준 비교로 그룹 전체 일치 여부 확인
+        if group.count(first) == len(group):
             prefix.append(first)
         else:
             break
@@ -726,9 +1046,13 @@ def local_cluster(
     """KR: TF-IDF 로컬 군집화. EN: Local TF-IDF clustering."""
 
     try:
+        import numpy as np
         from sklearn.cluster import DBSCAN, KMeans
-        from sklearn.feature_extraction.text import TfidfVectorizer
-        from sklearn.metrics.pairwise import cosine_similarity
+        from sklearn.feature_extraction.text import (
+            HashingVectorizer,
+            TfidfTransformer,
+            TfidfVectorizer,
+        )
     except ModuleNotFoundError:
         return simple_cluster(items, hints)
 
@@ -741,7 +1065,7 @@ def local_cluster(
         if not path:
             continue
         bucket = entry.get("bucket", "")
-        sample = entry.get("sample", "")
+        sample = entry.get("sample", "")[:CLUSTER_SAMPLE_CHARS]
         tokens = " ".join(
             [
                 entry.get("name", ""),
@@ -753,20 +1077,29 @@ def local_cluster(
                 sample,
             ]
         )
-        for hint in hints:
-            if hint in tokens.lower():
-                tokens += (" " + hint) * 3
-        documents.append(tokens)
+        tokens_lower = tokens.lower()
+        extras = [hint for hint in hints if hint in tokens_lower for _ in range(3)]
+        documents.append(tokens + " " + " ".join(extras) if extras else tokens)
         paths.append(path)
         weights.append(bucket)
 
     if not documents:
         return {"projects": []}
 
-    vectorizer = TfidfVectorizer(max_features=20000, ngram_range=(1, 2))
-    matrix = vectorizer.fit_transform(documents)
-
     n_docs = len(documents)
+    if n_docs >= HASHING_MIN_DOCS:
+        # 대규모 스캔: 어휘 사전 구축 없이 단일 패스 해싱 후 IDF 가중
+        hashed = HashingVectorizer(
+            n_features=HASHING_FEATURES,
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm=None,
+        ).transform(documents)
+        matrix = TfidfTransformer().fit_transform(hashed)
+    else:
+        vectorizer = TfidfVectorizer(max_features=20000, ngram_range=(1, 2))
+        matrix = vectorizer.fit_transform(documents)
+
     if n_docs <= 2:
         labels = [0] * n_docs
     elif n_docs <= 20:
@@ -785,13 +1118,15 @@ def local_cluster(
     for idx, cluster_label in enumerate(labels):
         groups[int(cluster_label)].append(idx)
 
-    cosine = cosine_similarity(matrix)
     projects: List[Dict[str, Any]] = []
     for group_id, indices in groups.items():
         doc_ids = [paths[i] for i in indices]
-        submatrix = cosine[[i for i in indices]][:, [i for i in indices]]
-        if submatrix.size:
-            mean_scores = submatrix.mean(axis=1)
+        # TF-IDF 행은 L2 정규화되어 있으므로 그룹 내 평균 코사인 = 행 · 중심 벡터.
+        # N×N 유사도 행렬 대신 그룹별 중심만 계산한다.
+        submatrix = matrix[indices]
+        centroid = np.asarray(submatrix.mean(axis=0)).ravel()
+        mean_scores = np.asarray(submatrix @ centroid).ravel()
+        if mean_scores.size:
             representative_idx = indices[int(mean_scores.argmax())]
         else:
             representative_idx = indices[0]
@@ -809,8 +1144,8 @@ def local_cluster(
         fallback_label = hint_seed or doc_ids[0]
         label = derive_project_label(doc_ids, fallback_label)
         confidence = 0.5
-        if submatrix.size:
-            confidence = float(submatrix.mean())
+        if mean_scores.size:
+            confidence = float(mean_scores.mean())
             confidence = max(0.5, min(0.95, confidence))
 
         bucket_counts = Counter(items[i].get("bucket", "tmp") for i in indices)
@@ -854,7 +1189,7 @@ def serialize_min_item(item: dict, max_sample_chars: int = 200) -> dict:
     # id가 없으면 path에서 생성
     item_id = item.get("id")
     if not item_id and "path" in item:
-        item_id = sha256_string(item["path"])
+        item_id = safe_id_for(item["path"])
 
     # sample이 없으면 extract_sample_text로 생성
     sample = item.get("sample", "")
@@ -1174,14 +1509,18 @@ def gpt_cluster_single_batch(
 
     def build_gpt_payload_ndjson(items: Sequence[Dict[str, Any]]) -> str:
         """NDJSON 형태로 페이로드 생성"""
-        safe_map = json.load(open(safe_map_path, encoding="utf-8"))
+        safe_map = read_safe_map(safe_map_path)
         ndjson_lines = []
+        changed = False
 
         for it in items:
             if "path" not in it:
                 continue
-            safe_id = sha256_string(it["path"])
-            safe_map[safe_id] = it["path"]
+            # 스캔에서 받은 safe_id를 그대로 써서 경로당 키 하나만 유지
+            safe_id = it.get("safe_id") or safe_id_for(it["path"])
+            if safe_map.get(safe_id) != it["path"]:
+                safe_map[safe_id] = it["path"]
+                changed = True
 
             # 최소화된 아이템 생성
             min_item = {
@@ -1193,13 +1532,9 @@ def gpt_cluster_single_batch(
             }
             ndjson_lines.append(json.dumps(min_item, ensure_ascii=False))
 
-        # safe_map 업데이트
-        json.dump(
-            safe_map,
-            open(safe_map_path, "w", encoding="utf-8"),
-            ensure_ascii=False,
-            indent=2,
-        )
+        # 새 항목이 있을 때만 safe_map 업데이트
+        if changed:
+            write_safe_map(safe_map_path, safe_map)
 
         return "\n".join(ndjson_lines)
 
@@ -1246,7 +1581,7 @@ def gpt_cluster_single_batch(
     data = json.loads(content)
 
     # safe_id → path 역매핑
-    safe_map = json.load(open(safe_map_path, encoding="utf-8"))
+    safe_map = read_safe_map(safe_map_path)
     projects = []
     for p in data.get("projects", []):
         ids = p.get("doc_ids", [])
@@ -1384,13 +1719,16 @@ def gpt_cluster(
 
     def build_gpt_payload(items: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
         click.echo(f"[gpt_cluster] Building payload from {len(items)} items")
-        safe_map = json.load(open(safe_map_path, encoding="utf-8"))
+        safe_map = read_safe_map(safe_map_path)
         safe_items = []
+        changed = False
         for it in items:
             if "path" not in it:
                 continue
-            safe_id = sha256_string(it["path"])
-            safe_map[safe_id] = it["path"]
+            safe_id = it.get("safe_id") or safe_id_for(it["path"])
+            if safe_map.get(safe_id) != it["path"]:
+                safe_map[safe_id] = it["path"]
+                changed = True
             safe_items.append(
                 {
                     "safe_id": safe_id,
@@ -1400,12 +1738,8 @@ def gpt_cluster(
                 }
             )
         click.echo(f"[gpt_cluster] Created {len(safe_items)} safe items")
-        json.dump(
-            safe_map,
-            open(safe_map_path, "w", encoding="utf-8"),
-            ensure_ascii=False,
-            indent=2,
-        )
+        if changed:
+            write_safe_map(safe_map_path, safe_map)
         return {"items": safe_items}
 
     payload = build_gpt_payload(items)
@@ -1459,7 +1793,7 @@ def gpt_cluster(
 
     # ★ 여기서 safe_id → path 역매핑
     click.echo("[gpt_cluster] Converting safe_ids back to file paths...")
-    safe_map = json.load(open(safe_map_path, encoding="utf-8"))
+    safe_map = read_safe_map(safe_map_path)
     projects = []
     for i, p in enumerate(data.get("projects", [])):
         ids = p.get("doc_ids", [])
@@ -1519,6 +1853,7 @@ def ensure_schema(base_dir: Path, schema: Dict[str, Any]) -> None:
         target.mkdir(parents=True, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=1024)
 def resolve_bucket_directory(base_dir: Path, bucket: str) -> Path:
     """KR: 버킷에 맞는 디렉토리 선택. EN: Resolve destination directory for bucket."""
 
@@ -1530,26 +1865,264 @@ def resolve_bucket_directory(base_dir: Path, bucket: str) -> Path:
 
 
 def versioned_destination(
-    dst_dir: Path, filename: str, hash7: str, conflict: str
+    dst_dir: Path,
+    filename: str,
+    hash7: str,
+    conflict: str,
+    claimed: Optional[Set[Path]] = None,
 ) -> Path:
-    """KR: 중복 버전 이름 처리. EN: Build destination path with hash suffix."""
+    """KR: 중복 버전 이름 처리(claimed는 예약된 경로). EN: Build destination path with hash suffix;
+    paths in `claimed` count as taken."""
+
+    def taken(path: Path) -> bool:
+        return (claimed is not None and path in claimed) or path.exists()
 
     stem = Path(filename).stem
     suffix = Path(filename).suffix
-    if stem.endswith(f"__{hash7}"):
-        candidate = dst_dir / f"{stem}{suffix}"
-    else:
-        candidate = dst_dir / f"{stem}__{hash7}{suffix}"
+    base = stem if stem.endswith(f"__{hash7}") else f"{stem}__{hash7}"
+    candidate = dst_dir / f"{base}{suffix}"
 
     if conflict == "overwrite":
         return dst_dir / f"{stem}{suffix}"
-    if conflict == "skip" and candidate.exists():
+    if conflict != "version" or not taken(candidate):
         return candidate
-    counter = 1
-    while candidate.exists() and conflict == "version":
-        candidate = dst_dir / f"{stem}__{hash7}_{counter}{suffix}"
-        counter += 1
-    return candidate
+    # _1, _2 … 순차 탐색 대신 32비트 무작위 접미사: 재시도 확률 약 2^-32
+    while True:
+        versioned = dst_dir / f"{base}_{os.urandom(4).hex()}{suffix}"
+        if not taken(versioned):
+            return versioned
+
+
+class JournalWriter:
+    """KR: 저널 줄을 모아 한 번에 기록한다. EN: Append journal lines in batches."""
+
+    def __init__(self, path: Path, batch_size: int = 256) -> None:
+        self._handle = path.open("ab", buffering=1 << 20)
+        self._buffer = bytearray()
+        self._pending = 0
+        self._batch = batch_size
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        self._buffer += json_bytes(entry)
+        self._buffer += b"\n"
+        self._pending += 1
+        if self._pending >= self._batch:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._handle.write(self._buffer)
+            self._buffer.clear()
+            self._pending = 0
+        self._handle.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._handle.close()
+
+    def __enter__(self) -> "JournalWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+JOURNAL_DB_SUFFIXES = frozenset({".db", ".sqlite", ".sqlite3"})
+JOURNAL_COLUMNS = (
+    "ts",
+    "code",
+    "project",
+    "bucket",
+    "src",
+    "dst",
+    "hash",
+    "mode",
+    "src_masked",
+    "dst_masked",
+    "error",
+)
+
+
+def is_journal_db(path: Path) -> bool:
+    """KR: SQLite 저널 경로 여부(확장자 기준). EN: Whether the journal path is SQLite."""
+
+    return path.suffix.lower() in JOURNAL_DB_SUFFIXES
+
+
+class JournalDB:
+    """KR: SQLite 저널(code/project/bucket 인덱스로 요약·롤백을 SQL로 처리).
+    EN: SQLite journal; summaries and rollback become indexed queries."""
+
+    def __init__(self, path: Path, batch_size: int = 256) -> None:
+        self.conn = sqlite3.connect(str(path), timeout=30.0)
+        cur = self.conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL;")
+        cur.execute("PRAGMA synchronous=NORMAL;")
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                ts INTEGER,
+                code TEXT,
+                project TEXT,
+                bucket TEXT,
+                src TEXT,
+                dst TEXT,
+                hash TEXT,
+                mode TEXT,
+                src_masked TEXT,
+                dst_masked TEXT,
+                error TEXT
+            )
+            """
+        )
+        for column in ("code", "project", "bucket"):
+            cur.execute(
+                f"CREATE INDEX IF NOT EXISTS entries_{column} ON entries ({column})"
+            )
+        self.conn.commit()
+        self._rows: List[tuple[Any, ...]] = []
+        self._batch = batch_size
+        self._insert = (
+            f"INSERT INTO entries ({', '.join(JOURNAL_COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in JOURNAL_COLUMNS)})"
+        )
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        self._rows.append(tuple(entry.get(column) for column in JOURNAL_COLUMNS))
+        if len(self._rows) >= self._batch:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._rows:
+            self.conn.executemany(self._insert, self._rows)
+            self._rows.clear()
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self) -> "JournalDB":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def iter_entries(self, code: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """KR: 기록 순서대로 항목 조회(NULL 열 제외). EN: Entries in write order, NULLs dropped."""
+
+        query = f"SELECT {', '.join(JOURNAL_COLUMNS)} FROM entries"
+        params: tuple[Any, ...] = ()
+        if code is not None:
+            query += " WHERE code = ?"
+            params = (code,)
+        for row in self.conn.execute(query + " ORDER BY rowid", params):
+            yield {
+                column: value
+                for column, value in zip(JOURNAL_COLUMNS, row)
+                if value is not None
+            }
+
+    def counts(self, column: str, default: str) -> Dict[str, int]:
+        """KR: 열별 GROUP BY 집계. EN: GROUP BY count over one column."""
+
+        query = (
+            f"SELECT COALESCE({column}, ?), COUNT(*) FROM entries "
+            f"GROUP BY COALESCE({column}, ?)"
+        )
+        return dict(self.conn.execute(query, (default, default)).fetchall())
+
+
+def open_journal(path: Path) -> Any:
+    """KR: 확장자에 맞는 저널 기록기. EN: Journal writer chosen by file suffix."""
+
+    return JournalDB(path) if is_journal_db(path) else JournalWriter(path)
+
+
+def fast_copy(source: Path, destination: Path) -> None:
+    """KR: copy_file_range 커널 내 복사(리플링크 지원) 후 메타데이터 복제, 실패 시 copy2.
+    EN: In-kernel copy_file_range (reflink-aware) plus copystat; fall back to copy2."""
+
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        shutil.copy2(source, destination)
+        return
+    try:
+        with source.open("rb") as src, destination.open("wb") as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = copy_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError as exc:
+        # 교차 장치·미지원 파일시스템 등은 사용자 공간 복사로 처리
+        if exc.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+            raise
+        shutil.copy2(source, destination)
+        return
+    shutil.copystat(source, destination)
+
+
+def transfer_file(
+    source: Path, destination: Path, mode: str, after: Optional[Future[None]] = None
+) -> None:
+    """KR: 파일 복사/이동(선행 전송 완료 후). EN: Copy or move a file once `after` is done."""
+
+    if after is not None:
+        wait([after])
+    if mode == "copy":
+        fast_copy(source, destination)
+        return
+    try:
+        # 같은 파일시스템이면 rename 한 번으로 끝난다(원자적, 데이터 복사 없음)
+        os.replace(source, destination)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(source, destination)
+
+
+def restore_file(src: Path, dst: Path, after: Sequence[Future[bool]] = ()) -> bool:
+    """KR: 정리된 파일을 원위치로 되돌린다. EN: Move an organized file back to its source."""
+
+    if after:
+        wait(after)
+    if not dst.exists():
+        return False
+    src.parent.mkdir(parents=True, exist_ok=True)
+    transfer_file(dst, src, "move")
+    return True
+
+
+def iter_ok_entries(journal_path: Path) -> Iterator[Dict[str, Any]]:
+    """KR: 저널에서 성공(OK) 항목만 스트리밍. EN: Stream the OK entries of a journal."""
+
+    if is_journal_db(journal_path):
+        journal_db = JournalDB(journal_path)
+        try:
+            yield from journal_db.iter_entries("OK")
+        finally:
+            journal_db.close()
+        return
+    with journal_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            entry = json_loads(line)
+            if entry.get("code") == "OK":
+                yield entry
+
+
+def reuse_blake7(source: Path, metadata: Dict[str, Any]) -> str:
+    """KR: 스캔 단계 BLAKE3를 재사용(파일 변경 시 재계산).
+    EN: Reuse the scan-phase BLAKE3; re-hash only when the file changed."""
+
+    stat = source.stat()
+    digest: Optional[str] = None
+    if metadata.get("size") == stat.st_size and metadata.get("mtime") == stat.st_mtime:
+        digest = metadata.get("blake3")
+    return str(digest[:7]) if digest else compute_blake7(source)
 
 
 def now_ms() -> int:
@@ -1572,15 +2145,224 @@ def emit_console_table(
         console.print(table)
 
 
+# ---------------------------------------------------------------------------
+# Pipeline stages (CLI 명령과 pipeline 이 공유, 디스크 입출력 없음)
+# ---------------------------------------------------------------------------
+
+
+def run_rules(data: Iterable[Dict[str, Any]], engine: RuleEngine) -> List[Dict[str, Any]]:
+    """KR: 스캔 항목에 버킷을 붙인다(제자리 갱신). EN: Tag scan entries with buckets in place."""
+
+    results: List[Dict[str, Any]] = []
+    pending: List[Dict[str, Any]] = []
+    records: List[DocumentRecord] = []
+    for entry in data:
+        if "error" in entry:
+            entry["bucket"] = "archive"
+        else:
+            # 검증은 한 번만, 분류는 필드별 리스트 배치로 수행
+            pending.append(entry)
+            records.append(record_from_entry(entry))
+        results.append(entry)
+
+    buckets = engine.classify_all(record_columns(records))
+    for entry, bucket in zip(pending, buckets):
+        entry["bucket"] = bucket
+
+    return results
+
+
+def run_cluster(
+    items: List[Dict[str, Any]], project_mode: str, safe_map_path: str, hints: List[str]
+) -> Dict[str, Any]:
+    """KR: 로컬/GPT 군집화(GPT 실패 시 로컬 폴백). EN: Cluster locally or via GPT with fallback."""
+
+    if project_mode.lower() == "gpt":
+        # GPT 모드 실행 - 401은 즉시 폴백, 기타 오류만 재시도
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                click.echo(f"[cluster] GPT mode attempt {attempt + 1}/{max_retries}")
+                output = gpt_cluster_new(items, safe_map_path=safe_map_path)
+                click.echo(f"[cluster] GPT mode succeeded on attempt {attempt + 1}")
+                break
+            except Exception as exc:
+                msg = str(exc)
+                # 401은 재시도 불가 → 즉시 로컬 폴백
+                if "401" in msg or "Unauthorized" in msg:
+                    click.echo(
+                        "[cluster] GPT mode fatal: 401 Unauthorized → no retry; fallback to local"
+                    )
+                    output = local_cluster(items, hints)
+                    break
+                click.echo(f"[cluster] GPT mode failed attempt {attempt + 1} ({exc})")
+                if attempt == max_retries - 1:
+                    click.echo(
+                        f"[cluster] GPT mode failed all {max_retries} attempts; fallback to local"
+                    )
+                    output = local_cluster(items, hints)
+                else:
+                    import time
+
+                    time.sleep(2)  # 2초 대기 후 재시도
+    else:
+        output = local_cluster(items, hints)
+    return output
+
+
+def run_organize(
+    projects: Iterable[Dict[str, Any]],
+    scores: Iterable[Dict[str, Any]],
+    target_root: Path,
+    mode: str,
+    conflict: str,
+    journal_path: Path,
+    schema: Dict[str, Any],
+) -> int:
+    """KR: 프로젝트별로 파일을 배치하고 저널을 남긴다(이동 수 반환).
+    EN: Place files per project, journal each step; return the move count."""
+
+    # 경로 문자열을 intern 해 두면 조회 시 동일 객체 비교로 끝난다
+    by_path = {sys.intern(item["path"]): item for item in scores if "path" in item}
+
+    target_root.mkdir(parents=True, exist_ok=True)
+    journal_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # 목적지는 순차로 예약하고 전송만 병렬로 실행, 저널은 계획 순서대로 기록
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    window = workers * 4  # 미기록 계획 항목 상한(메모리·rollback 범위 제한)
+    claimed: Set[Path] = set()
+    moved: Set[Path] = set()
+    made_dirs: Set[Path] = set()
+    chains: Dict[Path, Future[None]] = {}
+    plan: Deque[tuple[Dict[str, Any], Optional[Future[None]]]] = deque()
+    total_moves = 0
+
+    def drain(limit: int) -> None:
+        """KR: 완료된 계획 앞부분을 저널에 기록(limit 초과분은 완료 대기).
+        EN: Journal the finished head of the plan; wait while more than `limit` remain."""
+
+        nonlocal total_moves
+        while plan:
+            entry, future = plan[0]
+            if future is not None:
+                if len(plan) <= limit and not future.done():
+                    break
+                try:
+                    future.result()
+                    entry["code"] = "OK"
+                    total_moves += 1
+                except Exception as exc:  # pragma: no cover - resilience branch
+                    entry = {
+                        "ts": 0,
+                        "code": "ERR",
+                        "project": entry["project"],
+                        "bucket": entry["bucket"],
+                        "src": entry["src"],
+                        "error": str(exc),
+                    }
+            plan.popleft()
+            entry["ts"] = now_ms()
+            log.write(entry)
+
+    with open_journal(journal_path) as log, ThreadPoolExecutor(workers) as pool:
+        try:
+            for project in projects:
+                label = project.get("project_label") or "misc"
+                base_dir = target_root / label
+                # 같은 라벨이 여러 번 나와도 스키마 디렉토리는 한 번만 만든다
+                if base_dir not in made_dirs:
+                    ensure_schema(base_dir, schema)
+                    made_dirs.add(base_dir)
+                for doc_path in project.get("doc_ids", []):
+                    # 중단돼도 끝난 전송은 rollback 가능하도록 바로 기록
+                    drain(window)
+                    source = Path(doc_path)
+                    if source in moved or not source.exists():
+                        plan.append(
+                            (
+                                {
+                                    "ts": 0,
+                                    "code": "MISS",
+                                    "project": label,
+                                    "src": str(source),
+                                    "src_masked": sanitize_path(str(source)),
+                                },
+                                None,
+                            )
+                        )
+                        continue
+
+                    metadata = by_path.get(sys.intern(doc_path), {})
+                    bucket = metadata.get("bucket", "tmp")
+                    destination_dir = resolve_bucket_directory(base_dir, bucket)
+                    if destination_dir not in made_dirs:
+                        destination_dir.mkdir(parents=True, exist_ok=True)
+                        made_dirs.add(destination_dir)
+
+                    try:
+                        hash7 = reuse_blake7(source, metadata)
+                        destination = versioned_destination(
+                            destination_dir, source.name, hash7, conflict, claimed
+                        )
+                        entry: Dict[str, Any] = {
+                            "ts": 0,
+                            "code": "SKIP",
+                            "project": label,
+                            "bucket": bucket,
+                            "src": str(source),
+                            "dst": str(destination),
+                            "src_masked": sanitize_path(str(source)),
+                            "dst_masked": sanitize_path(str(destination)),
+                            "hash": hash7,
+                            "mode": mode,
+                        }
+                        taken = destination in claimed or destination.exists()
+                        if taken and conflict == "skip":
+                            plan.append((entry, None))
+                            continue
+                        # 같은 목적지(overwrite)는 이전 전송이 끝난 뒤 실행
+                        future = pool.submit(
+                            transfer_file, source, destination, mode, chains.get(destination)
+                        )
+                        chains[destination] = future
+                        claimed.add(destination)
+                        if mode != "copy":
+                            moved.add(source)
+                        plan.append((entry, future))
+                    except Exception as exc:  # pragma: no cover - resilience branch
+                        plan.append(
+                            (
+                                {
+                                    "ts": 0,
+                                    "code": "ERR",
+                                    "project": label,
+                                    "bucket": bucket,
+                                    "src": str(source),
+                                    "error": str(exc),
+                                },
+                                None,
+                            )
+                        )
+        finally:
+            drain(0)
+
+    return total_moves
+
+
 # ---------------------------------------------------------------------------
 # Click CLI commands
 # ---------------------------------------------------------------------------
 
 
 @click.group()
-def cli() -> None:
+@click.pass_context
+def cli(ctx: click.Context) -> None:
     """KR: devmind CLI 루트. EN: Root command group."""
 
+    # 명령 종료 시 캐시 연결을 닫아 DB 파일 잠금을 해제
+    ctx.call_on_close(close_cache_connections)
+
 
 @cli.command()
 @click.option("--paths", multiple=True, required=True, help="루트 경로 다중 지정")
@@ -1642,25 +2424,10 @@ def scan(
 def rules(scan_path: str, emit: str, config_path: str) -> None:
     """KR: 규칙 기반 버킷 태깅. EN: Apply bucket rules to scanned data."""
 
-    data = json.loads(Path(scan_path).read_text(encoding="utf-8"))
-    engine = RuleEngine.from_config(Path(config_path))
-    results: List[Dict[str, Any]] = []
-
-    for entry in data:
-        if "error" in entry:
-            entry["bucket"] = "archive"
-            results.append(entry)
-            continue
-        record = record_from_entry(entry)
-        bucket = engine.classify(record)
-        entry["bucket"] = bucket
-        results.append(entry)
-
+    results = run_rules(read_json_file(scan_path), RuleEngine.from_config(Path(config_path)))
     emit_path = Path(emit)
     emit_path.parent.mkdir(parents=True, exist_ok=True)
-    emit_path.write_text(
-        json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    write_json_file(emit_path, results)
     click.echo(f"[rules] -> {emit_path}")
 
 
@@ -1682,44 +2449,13 @@ def cluster(
 ) -> None:
     """KR: 프로젝트 군집화. EN: Cluster files into projects."""
 
-    items = json.loads(Path(scores).read_text(encoding="utf-8"))
+    items = read_json_file(scores)
     hints_list = [token.strip() for token in hints.split(",") if token.strip()]
-    if project_mode.lower() == "gpt":
-        # GPT 모드 실행 - 401은 즉시 폴백, 기타 오류만 재시도
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                click.echo(f"[cluster] GPT mode attempt {attempt + 1}/{max_retries}")
-                output = gpt_cluster_new(items, safe_map_path=safe_map_path)
-                click.echo(f"[cluster] GPT mode succeeded on attempt {attempt + 1}")
-                break
-            except Exception as exc:
-                msg = str(exc)
-                # 401은 재시도 불가 → 즉시 로컬 폴백
-                if "401" in msg or "Unauthorized" in msg:
-                    click.echo(
-                        "[cluster] GPT mode fatal: 401 Unauthorized → no retry; fallback to local"
-                    )
-                    output = local_cluster(items, hints_list)
-                    break
-                click.echo(f"[cluster] GPT mode failed attempt {attempt + 1} ({exc})")
-                if attempt == max_retries - 1:
-                    click.echo(
-                        f"[cluster] GPT mode failed all {max_retries} attempts; fallback to local"
-                    )
-                    output = local_cluster(items, hints_list)
-                else:
-                    import time
-
-                    time.sleep(2)  # 2초 대기 후 재시도
-    else:
-        output = local_cluster(items, hints_list)
+    output = run_cluster(items, project_mode, safe_map_path, hints_list)
 
     emit_path = Path(emit)
     emit_path.parent.mkdir(parents=True, exist_ok=True)
-    emit_path.write_text(
-        json.dumps(output, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    write_json_file(emit_path, output)
     click.echo(
         f"[cluster/{project_mode}] {len(output.get('projects', []))} projects -> {emit_path}"
     )
@@ -1751,98 +2487,99 @@ def organize(
 ) -> None:
     """KR: 프로젝트 구조에 맞춰 이동. EN: Organize files into project structure."""
 
-    schema = load_schema(Path(schema_path))
-    projects_data = json.loads(Path(projects).read_text(encoding="utf-8"))
-    scores_data = json.loads(Path(scores).read_text(encoding="utf-8"))
-    by_path = {item["path"]: item for item in scores_data if "path" in item}
-
     target_root = Path(target)
-    target_root.mkdir(parents=True, exist_ok=True)
-
     journal_path = Path(journal)
-    journal_path.parent.mkdir(parents=True, exist_ok=True)
+    total_moves = run_organize(
+        iter_json_items(projects, "projects.item"),
+        read_json_file(scores),
+        target_root,
+        mode,
+        conflict,
+        journal_path,
+        load_schema(Path(schema_path)),
+    )
+    click.echo(
+        f"[organize] moves={total_moves} -> {target_root} (journal: {journal_path})"
+    )
 
-    total_moves = 0
-    with journal_path.open("a", encoding="utf-8") as log:
-        for project in projects_data.get("projects", []):
-            label = project.get("project_label") or "misc"
-            base_dir = target_root / label
-            ensure_schema(base_dir, schema)
-            for doc_path in project.get("doc_ids", []):
-                source = Path(doc_path)
-                if not source.exists():
-                    log.write(
-                        json.dumps(
-                            {
-                                "ts": now_ms(),
-                                "code": "MISS",
-                                "project": label,
-                                "src": str(source),
-                                "src_masked": sanitize_path(str(source)),
-                            }
-                        )
-                        + "\n"
-                    )
-                    continue
 
-                metadata = by_path.get(doc_path, {})
-                bucket = metadata.get("bucket", "tmp")
-                destination_dir = resolve_bucket_directory(base_dir, bucket)
-                destination_dir.mkdir(parents=True, exist_ok=True)
+@cli.command()
+@click.option("--paths", multiple=True, required=True, help="루트 경로 다중 지정")
+@click.option("--emit", default=str(DEFAULT_SCAN_EMIT), show_default=True)
+@click.option(
+    "--safe-map", "safe_map_path", default=str(DEFAULT_SAFE_MAP), show_default=True
+)
+@click.option("--config", "config_path", default="rules.yml", show_default=True)
+@click.option(
+    "--project-mode",
+    type=click.Choice(["local", "gpt"], case_sensitive=False),
+    default="local",
+    show_default=True,
+)
+@click.option("--hints", default=",".join(DEFAULT_HINTS), show_default=True)
+@click.option("--target", default="C:/PROJECTS_STRUCT", show_default=True)
+@click.option(
+    "--mode", default="move", type=click.Choice(["move", "copy"]), show_default=True
+)
+@click.option(
+    "--conflict",
+    default="version",
+    type=click.Choice(["version", "skip", "overwrite"]),
+    show_default=True,
+)
+@click.option("--journal", default=str(DEFAULT_JOURNAL), show_default=True)
+@click.option("--schema", "schema_path", default="schema.yml", show_default=True)
+def pipeline(
+    paths: Sequence[str],
+    emit: str,
+    safe_map_path: str,
+    config_path: str,
+    project_mode: str,
+    hints: str,
+    target: str,
+    mode: str,
+    conflict: str,
+    journal: str,
+    schema_path: str,
+) -> None:
+    """KR: scan→rules→cluster→organize 한 번에 실행. EN: Run scan, rules, cluster, organize."""
+
+    ensure_cache_dir()
+    stats = stream_paths_to_files(
+        paths=tuple(Path(p) for p in paths),
+        emit_path=Path(emit),
+        safe_map_path=Path(safe_map_path),
+    )
+    click.echo(f"[scan] {stats.processed} items -> {emit}")
 
-                try:
-                    hash7 = compute_blake7(source)
-                    destination = versioned_destination(
-                        destination_dir, source.name, hash7, conflict
-                    )
-                    if destination.exists() and conflict == "skip":
-                        code = "SKIP"
-                    else:
-                        if mode == "copy":
-                            shutil.copy2(source, destination)
-                        else:
-                            shutil.move(source, destination)
-                        code = "OK"
-                        total_moves += 1
-                    log.write(
-                        json.dumps(
-                            {
-                                "ts": now_ms(),
-                                "code": code,
-                                "project": label,
-                                "bucket": bucket,
-                                "src": str(source),
-                                "dst": str(destination),
-                                "src_masked": sanitize_path(str(source)),
-                                "dst_masked": sanitize_path(str(destination)),
-                                "hash": hash7,
-                                "mode": mode,
-                            }
-                        )
-                        + "\n"
-                    )
-                except Exception as exc:  # pragma: no cover - resilience branch
-                    log.write(
-                        json.dumps(
-                            {
-                                "ts": now_ms(),
-                                "code": "ERR",
-                                "project": label,
-                                "bucket": bucket,
-                                "src": str(source),
-                                "error": str(exc),
-                            }
-                        )
-                        + "\n"
-                    )
+    # 스캔 결과만 한 번 읽고 이후 단계는 메모리의 객체를 그대로 넘긴다
+    scores = run_rules(read_json_file(emit), RuleEngine.from_config(Path(config_path)))
+    click.echo(f"[rules] {len(scores)} items")
+    hints_list = [token.strip() for token in hints.split(",") if token.strip()]
+    clustered = run_cluster(scores, project_mode, safe_map_path, hints_list)
+    click.echo(f"[cluster/{project_mode}] {len(clustered.get('projects', []))} projects")
 
+    target_root = Path(target)
+    journal_path = Path(journal)
+    total_moves = run_organize(
+        clustered.get("projects", []),
+        scores,
+        target_root,
+        mode,
+        conflict,
+        journal_path,
+        load_schema(Path(schema_path)),
+    )
     click.echo(
         f"[organize] moves={total_moves} -> {target_root} (journal: {journal_path})"
     )
 
 
-def summarise_journal(journal_path: Path) -> Dict[str, Any]:
-    """KR: 저널을 요약한다. EN: Summarise journal entries for reporting."""
+def summarise_journal(
+    journal_path: Path, keep_entries: bool = False
+) -> Dict[str, Any]:
+    """KR: 저널을 한 줄씩 스트리밍하며 요약한다(keep_entries 시 원본 항목 포함).
+    EN: Stream-summarise journal entries; include raw entries only on request."""
 
     summary: Dict[str, Any] = {
         "total": 0,
@@ -1852,32 +2589,134 @@ def summarise_journal(journal_path: Path) -> Dict[str, Any]:
         "missing": 0,
         "projects": defaultdict(int),
         "buckets": defaultdict(int),
-        "entries": [],
     }
+    if keep_entries:
+        summary["entries"] = []
     if not journal_path.exists():
         return summary
-    for line in journal_path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        entry = json.loads(line)
-        summary["entries"].append(entry)
-        summary["total"] += 1
-        code = entry.get("code")
-        project = entry.get("project", "misc")
-        bucket = entry.get("bucket", "tmp")
-        summary["projects"][project] += 1
-        summary["buckets"][bucket] += 1
-        if code == "OK":
-            summary["ok"] += 1
-        elif code == "ERR":
-            summary["errors"] += 1
-        elif code == "SKIP":
-            summary["skipped"] += 1
-        elif code == "MISS":
-            summary["missing"] += 1
+    if is_journal_db(journal_path):
+        # SQLite 저널은 인덱스 기반 GROUP BY 세 번으로 요약
+        with JournalDB(journal_path) as journal_db:
+            code_counts = journal_db.counts("code", "")
+            summary["projects"].update(journal_db.counts("project", "misc"))
+            summary["buckets"].update(journal_db.counts("bucket", "tmp"))
+            if keep_entries:
+                summary["entries"] = list(journal_db.iter_entries())
+        summary["total"] = sum(code_counts.values())
+        summary["ok"] = code_counts.get("OK", 0)
+        summary["errors"] = code_counts.get("ERR", 0)
+        summary["skipped"] = code_counts.get("SKIP", 0)
+        summary["missing"] = code_counts.get("MISS", 0)
+        return summary
+    entries: Optional[List[Dict[str, Any]]] = summary.get("entries")
+
+    def keys(handle: Iterable[str]) -> Iterator[tuple[Any, Any, Any]]:
+        for line in handle:
+            if not line.strip():
+                continue
+            entry = json_loads(line)
+            if entries is not None:
+                entries.append(entry)
+            yield entry.get("code"), entry.get("project", "misc"), entry.get("bucket", "tmp")
+
+    # (code, project, bucket) 조합을 C 구현 Counter 로 한 번에 세고 고유 조합만 합산
+    with journal_path.open("r", encoding="utf-8") as handle:
+        combos = Counter(keys(handle))
+    codes: Counter[Any] = Counter()
+    for (code, project, bucket), count in combos.items():
+        codes[code] += count
+        summary["projects"][project] += count
+        summary["buckets"][bucket] += count
+    summary["total"] = sum(codes.values())
+    summary["ok"] = codes["OK"]
+    summary["errors"] = codes["ERR"]
+    summary["skipped"] = codes["SKIP"]
+    summary["missing"] = codes["MISS"]
     return summary
 
 
+# 리포트 HTML 틀은 import 시 한 번만 dedent 한다 (CSS 중괄호는 {{ }}로 이스케이프)
+TABLE_TEMPLATE = textwrap.dedent(
+    """
+    <section>
+      <h2>{title}</h2>
+      <table>
+        <thead><tr><th>Label</th><th>Count</th></tr></thead>
+        <tbody>{rows}</tbody>
+      </table>
+    </section>
+    """
+)
+
+REPORT_TEMPLATE = textwrap.dedent(
+    """
+    <!doctype html>
+    <html lang="ko">
+    <head>
+      <meta charset="utf-8" />
+      <title>Projects Summary</title>
+      <style>
+        body {{
+          background:#0B1220;
+          color:#E5E7EB;
+          font-family:'Inter', system-ui;
+          margin:0;
+          padding:24px;
+        }}
+        h1 {{ text-align:center; color:#60A5FA; }}
+        h2 {{
+          color:#22D3EE;
+          border-bottom:1px solid #1F2937;
+          padding-bottom:8px;
+        }}
+        .cards {{
+          display:grid;
+          grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+          gap:16px;
+          margin:24px auto;
+          max-width:1000px;
+        }}
+        .card {{
+          background:#111827;
+          border:1px solid #1F2937;
+          border-radius:12px;
+          padding:16px;
+          text-align:center;
+        }}
+        table {{
+          width:100%;
+          border-collapse:collapse;
+          margin:24px 0;
+          background:#111827;
+          border-radius:12px;
+          overflow:hidden;
+        }}
+        th, td {{
+          padding:12px 16px;
+          border-bottom:1px solid #1F2937;
+          text-align:left;
+        }}
+        section {{ max-width:1000px; margin:0 auto 32px auto; }}
+        footer {{
+          text-align:center;
+          color:#6B7280;
+          margin-top:32px;
+          font-family:'JetBrains Mono', monospace;
+        }}
+      </style>
+    </head>
+    <body>
+      <h1>프로젝트 자동 정리 리포트 / Project Auto-Organize Report</h1>
+      <div class="cards">{cards}</div>
+      {project_table}
+      {bucket_table}
+      <footer>Generated at {generated_at}</footer>
+    </body>
+    </html>
+    """
+)
+
+
 def build_report_cards(summary: Dict[str, Any]) -> str:
     """KR: HTML 카드 생성. EN: Build HTML cards for report."""
 
@@ -1913,20 +2752,12 @@ def build_table(title: str, mapping: Dict[str, int]) -> str:
         rows = "<tr><td>—</td><td>0</td></tr>"
     else:
         rows = "".join(
-            f"<tr><td>{html.escape(key)}</td><td>{value}</td></tr>"
-            for key, value in sorted(mapping.items(), key=lambda kv: (-kv[1], kv[0]))
+            [
+                f"<tr><td>{html.escape(key)}</td><td>{value}</td></tr>"
+                for key, value in sorted(mapping.items(), key=lambda kv: (-kv[1], kv[0]))
+            ]
         )
-    return textwrap.dedent(
-        f"""
-        <section>
-          <h2>{html.escape(title)}</h2>
-          <table>
-            <thead><tr><th>Label</th><th>Count</th></tr></thead>
-            <tbody>{rows}</tbody>
-          </table>
-        </section>
-        """
-    )
+    return TABLE_TEMPLATE.format(title=html.escape(title), rows=rows)
 
 
 @cli.command()
@@ -1945,72 +2776,11 @@ def report(journal: str, out: str) -> None:
     )
     bucket_table = build_table("버킷 분포 / Bucket Distribution", summary["buckets"])
 
-    html_output = textwrap.dedent(
-        f"""
-        <!doctype html>
-        <html lang="ko">
-        <head>
-          <meta charset="utf-8" />
-          <title>Projects Summary</title>
-          <style>
-            body {{
-              background:#0B1220;
-              color:#E5E7EB;
-              font-family:'Inter', system-ui;
-              margin:0;
-              padding:24px;
-            }}
-            h1 {{ text-align:center; color:#60A5FA; }}
-            h2 {{
-              color:#22D3EE;
-              border-bottom:1px solid #1F2937;
-              padding-bottom:8px;
-            }}
-            .cards {{
-              display:grid;
-              grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-              gap:16px;
-              margin:24px auto;
-              max-width:1000px;
-            }}
-            .card {{
-              background:#111827;
-              border:1px solid #1F2937;
-              border-radius:12px;
-              padding:16px;
-              text-align:center;
-            }}
-            table {{
-              width:100%;
-              border-collapse:collapse;
-              margin:24px 0;
-              background:#111827;
-              border-radius:12px;
-              overflow:hidden;
-            }}
-            th, td {{
-              padding:12px 16px;
-              border-bottom:1px solid #1F2937;
-              text-align:left;
-            }}
-            section {{ max-width:1000px; margin:0 auto 32px auto; }}
-            footer {{
-              text-align:center;
-              color:#6B7280;
-              margin-top:32px;
-              font-family:'JetBrains Mono', monospace;
-            }}
-          </style>
-        </head>
-        <body>
-          <h1>프로젝트 자동 정리 리포트 / Project Auto-Organize Report</h1>
-          <div class="cards">{cards_html}</div>
-          {project_table}
-          {bucket_table}
-          <footer>Generated at {time.strftime('%Y-%m-%d %H:%M:%S')}</footer>
-        </body>
-        </html>
-        """
+    html_output = REPORT_TEMPLATE.format(
+        cards=cards_html,
+        project_table=project_table,
+        bucket_table=bucket_table,
+        generated_at=time.strftime("%Y-%m-%d %H:%M:%S"),
     )
 
     html_path = Path(out)
@@ -2025,10 +2795,7 @@ def report(journal: str, out: str) -> None:
         "projects": dict(summary["projects"]),
         "buckets": dict(summary["buckets"]),
     }
-    (reports_dir / "projects_summary.json").write_text(
-        json.dumps(json_summary, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    write_json_file(reports_dir / "projects_summary.json", json_summary)
 
     csv_path = reports_dir / "projects_summary.csv"
     with csv_path.open("w", encoding="utf-8", newline="") as handle:
@@ -2054,21 +2821,20 @@ def rollback(journal: str) -> None:
         click.echo("[rollback] journal not found")
         sys.exit(1)
 
-    entries = [
-        json.loads(line)
-        for line in journal_path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
-    restored = 0
-    for entry in reversed(entries):
-        if entry.get("code") != "OK":
-            continue
-        src = Path(entry.get("src", ""))
-        dst = Path(entry.get("dst", ""))
-        if dst.exists():
-            src.parent.mkdir(parents=True, exist_ok=True)
-            shutil.move(dst, src)
-            restored += 1
+    # 역순으로 복원하되 같은 경로를 건드리는 작업끼리만 순서를 지킨다
+    entries = list(iter_ok_entries(journal_path))
+    entries.reverse()
+    last_touch: Dict[Path, Future[bool]] = {}
+    futures: List[Future[bool]] = []
+    with ThreadPoolExecutor(min(32, (os.cpu_count() or 1) * 4)) as pool:
+        for entry in entries:
+            src = Path(entry.get("src", ""))
+            dst = Path(entry.get("dst", ""))
+            after = [last_touch[path] for path in (src, dst) if path in last_touch]
+            future = pool.submit(restore_file, src, dst, after)
+            last_touch[src] = last_touch[dst] = future
+            futures.append(future)
+        restored = sum(future.result() for future in futures)
     click.echo(f"[rollback] restored={restored}")
 
 
@@ -7,11 +7,11 @@ import asyncio
 from typing import Dict, Any, List, Sequence
 
 
-def sha256_string(s: str) -> str:
-    """문자열의 SHA256 해시 반환"""
+def safe_id_for(path: str) -> str:
+    """경로의 128비트 BLAKE2b safe_id 반환 (devmind.safe_id_for와 동일)"""
     import hashlib
 
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(path.encode("utf-8", errors="ignore"), digest_size=16).hexdigest()
 
 
 def extract_sample_text(item: dict, limit_chars: int = 200) -> str:
@@ -56,7 +56,7 @@ def serialize_min_item(item: dict, max_sample_chars: int = 200) -> dict:
     # id가 없으면 path에서 생성
     item_id = item.get("id")
     if not item_id and "path" in item:
-        item_id = sha256_string(item["path"])
+        item_id = safe_id_for(item["path"])
 
     # sample이 없으면 extract_sample_text로 생성
     sample = item.get("sample", "")
@@ -27,10 +27,16 @@ def cli() -> None:
     """Autosort 명령 그룹입니다./Autosort command group."""
 
 
-def run_scan(paths: Sequence[Path], sample_bytes: int, emit: Path, safe_map_path: Path) -> None:
+def run_scan(
+    paths: Sequence[Path],
+    sample_bytes: int,
+    emit: Path,
+    safe_map_path: Path,
+    scan_threads: int | None = None,
+) -> None:
     """스캔 단계를 실행합니다./Execute scan stage."""
 
-    records, safe_map = scan_paths(paths, sample_bytes=sample_bytes)
+    records, safe_map = scan_paths(paths, sample_bytes=sample_bytes, workers=scan_threads)
     emit_scan(records, safe_map, emit, safe_map_path)
     click.echo(f"[scan] {len(records)} items saved to {emit}")
 
@@ -48,10 +54,22 @@ def run_scan(paths: Sequence[Path], sample_bytes: int, emit: Path, safe_map_path
     show_default=True,
     type=click.Path(path_type=Path),
 )
-def scan_command(paths: Sequence[Path], sample_bytes: int, emit: Path, safe_map_path: Path) -> None:
+@click.option(
+    "--scan-threads",
+    default=None,
+    type=click.IntRange(min=1),
+    help="파일 stat·샘플 병렬 스레드 수(기본: min(32, CPU×4))",
+)
+def scan_command(
+    paths: Sequence[Path],
+    sample_bytes: int,
+    emit: Path,
+    safe_map_path: Path,
+    scan_threads: int | None,
+) -> None:
     """선택한 경로를 스캔합니다./Scan selected directories."""
 
-    run_scan(paths, sample_bytes, emit, safe_map_path)
+    run_scan(paths, sample_bytes, emit, safe_map_path, scan_threads)
 
 
 def run_rules(scan_path: Path, emit: Path, rules_config: Path) -> None:
@@ -14,7 +14,7 @@ import yaml
 from yaml import YAMLError
 
 from scan import FileRecord
-from utils import write_json
+from utils import YAML_LOADER, write_json
 
 try:  # pragma: no cover - optional dependency
     from sklearn.cluster import DBSCAN, KMeans
@@ -68,9 +68,9 @@ def load_rules_config(path: Path | None) -> list[tuple[str, str]]:
     if path and path.exists():
         raw_text = path.read_text(encoding="utf-8")
         try:
-            data = yaml.safe_load(raw_text)
+            data = yaml.load(raw_text, Loader=YAML_LOADER)
         except YAMLError:
-            data = yaml.safe_load(_sanitize_rules_yaml(raw_text))
+            data = yaml.load(_sanitize_rules_yaml(raw_text), Loader=YAML_LOADER)
         rules = data.get("rules", []) if isinstance(data, dict) else []
         loaded: list[tuple[str, str]] = []
         for item in rules:
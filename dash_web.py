@@ -2,22 +2,30 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import io
 import json
+import multiprocessing
 import os
 import queue
 import subprocess
 import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Sequence
+from typing import IO, Any, Sequence, cast
 
-import altair as alt
+import click
+import numpy as np
 import pandas as pd  # type: ignore[import-untyped]
 import streamlit as st
 
 from organize import load_schema_config
 from report import load_journal, summarize
-from scan import load_records
+from scan import FileRecord, load_records
 
 BASE = Path(__file__).parent.resolve()
 CACHE = BASE / ".cache"
@@ -28,6 +36,12 @@ SCHEMA_PATH = BASE / "schema.yml"
 RULES_PATH = BASE / "rules.yml"
 
 PIPELINE_STEPS = ["scan", "rules", "cluster", "organize", "report"]
+MAX_LOG_LINE_BYTES = 700
+MAX_LOG_LINES = 800
+# 800줄 × 700바이트보다 작게 잡아 긴 줄이 많을 때 바이트 예산이 먼저 적용됩니다./
+# Below 800 × 700 bytes so the byte budget binds first when lines run long.
+MAX_LOG_BYTES = 256_000
+MAX_BROWSER_ROWS = 200
 
 
 def build_step_command(step: str, roots: Sequence[str], mode: str) -> list[str]:
@@ -98,16 +112,176 @@ def run_subprocess(cmd: Sequence[str], output_queue: "queue.Queue[object]") -> i
 
     env = dict(os.environ)
     env.setdefault("PYTHONUNBUFFERED", "1")
+    env.setdefault("PYTHONIOENCODING", "utf-8")
     process = subprocess.Popen(
-        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, cwd=str(BASE), env=env
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=str(BASE), env=env
     )
     assert process.stdout is not None
-    for line in process.stdout:
-        output_queue.put(line.rstrip())
+    for raw in process.stdout:
+        # 디코딩 전에 바이트 단위로 자릅니다./Truncate at the bytes layer before decoding.
+        line = raw.rstrip(b"\r\n")[:MAX_LOG_LINE_BYTES]
+        output_queue.put(line.decode("utf-8", errors="ignore"))
     process.wait()
     return process.returncode
 
 
+class LogBuffer:
+    """줄 수와 바이트 예산으로 제한된 로그 버퍼입니다./Log buffer bounded by lines and bytes."""
+
+    def __init__(self, max_lines: int = MAX_LOG_LINES, max_bytes: int = MAX_LOG_BYTES) -> None:
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.lines: deque[str] = deque()
+        self._size = 0
+
+    def append(self, line: str) -> None:
+        """줄을 추가하고 예산을 넘는 오래된 줄을 버립니다./Append and evict lines over budget."""
+
+        self.lines.append(line)
+        self._size += len(line)
+        while self.lines and (len(self.lines) > self.max_lines or self._size > self.max_bytes):
+            self._size -= len(self.lines.popleft())
+
+    def text(self) -> str:
+        """렌더링용 텍스트를 반환합니다./Return text for rendering."""
+
+        return "\n".join(self.lines)
+
+
+class _QueueWriter(io.TextIOBase):
+    """쓰기 출력을 줄 단위로 큐에 전달합니다./Forward written output to a queue line by line."""
+
+    def __init__(self, output_queue: "queue.Queue[object]") -> None:
+        super().__init__()
+        self._queue = output_queue
+        self._pending = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._pending += text
+        *lines, self._pending = self._pending.split("\n")
+        for line in lines:
+            self._queue.put(line.rstrip("\r")[:MAX_LOG_LINE_BYTES])
+        return len(text)
+
+    def flush(self) -> None:
+        if self._pending:
+            self._queue.put(self._pending[:MAX_LOG_LINE_BYTES])
+            self._pending = ""
+
+
+# 워커 프로세스 쪽 로그 큐입니다./Log queue on the worker-process side.
+_WORKER_LOG_QUEUE: Any = None
+_STEP_DONE = "__autosort_step_done__"
+
+
+def _init_step_worker(log_queue: Any) -> None:
+    """워커 프로세스를 초기화합니다./Initialise the step worker process."""
+
+    global _WORKER_LOG_QUEUE
+    _WORKER_LOG_QUEUE = log_queue
+    # 서브프로세스 경로와 같이 BASE 기준으로 상대 경로를 해석합니다./
+    # Resolve relative paths against BASE, like the subprocess path does.
+    os.chdir(BASE)
+
+
+def _run_cli_step(args: list[str]) -> int:
+    """워커 프로세스에서 CLI 단계를 실행합니다./Run one CLI step inside the worker process."""
+
+    from autosort import cli
+
+    # 단일 워커 전용 프로세스이므로 표준 출력 교체가 다른 작업에 새지 않습니다./
+    # The process runs one step at a time, so swapping stdio cannot leak elsewhere.
+    writer = _QueueWriter(_WORKER_LOG_QUEUE)
+    rc = 0
+    try:
+        with contextlib.redirect_stdout(writer), contextlib.redirect_stderr(writer):
+            cli.main(args=args, prog_name="autosort", standalone_mode=False)
+    except click.exceptions.Exit as exc:
+        rc = exc.exit_code
+    except click.ClickException as exc:
+        exc.show(file=cast(IO[str], writer))
+        rc = exc.exit_code
+    except click.Abort:
+        rc = 1
+    except SystemExit as exc:
+        rc = exc.code if isinstance(exc.code, int) else 1
+    except Exception as exc:  # pragma: no cover - surfaced in the log panel
+        writer.write(f"{type(exc).__name__}: {exc}\n")
+        rc = 1
+    finally:
+        writer.flush()
+        _WORKER_LOG_QUEUE.put(_STEP_DONE)
+    return rc
+
+
+class StepRunner:
+    """단일 워커 프로세스 풀로 단계를 실행합니다./Run steps in a persistent single-worker pool."""
+
+    def __init__(self) -> None:
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._start()
+
+    def _start(self) -> None:
+        self.log_queue = self._ctx.Queue()
+        self.pool = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=self._ctx,
+            initializer=_init_step_worker,
+            initargs=(self.log_queue,),
+        )
+
+    def run(self, cmd: Sequence[str], output_queue: "queue.Queue[object]") -> int:
+        """단계를 실행하고 로그를 큐로 전달합니다./Run a step and forward its log lines."""
+
+        # 동시 실행은 직렬화해 로그 큐가 섞이지 않게 합니다./Serialise runs so logs never interleave.
+        with self._lock:
+            future = self.pool.submit(_run_cli_step, list(cmd[2:]))
+            while True:
+                try:
+                    item = self.log_queue.get(timeout=0.1)
+                except queue.Empty:
+                    if future.done() and future.exception() is not None:
+                        break
+                    continue
+                if item == _STEP_DONE:
+                    break
+                output_queue.put(item)
+            try:
+                return future.result()
+            except BrokenProcessPool as exc:
+                # 워커가 죽어도 대시보드는 유지하고 다음 실행에서 새로 띄웁니다./
+                # A crashed worker fails the step only; the next run gets a fresh one.
+                output_queue.put(f"step worker crashed: {exc}")
+                self.pool.shutdown(wait=False, cancel_futures=True)
+                self._start()
+                return 1
+
+
+@st.cache_resource
+def get_step_runner() -> StepRunner:
+    """재실행 간 공유되는 단계 실행기를 반환합니다./Return the runner shared across reruns."""
+
+    return StepRunner()
+
+
+def run_in_process(cmd: Sequence[str], output_queue: "queue.Queue[object]") -> int:
+    """인터프리터 재기동 없이 CLI를 실행합니다./Run the CLI without spawning an interpreter."""
+
+    return get_step_runner().run(cmd, output_queue)
+
+
+def run_step(cmd: Sequence[str], output_queue: "queue.Queue[object]") -> int:
+    """설정에 따라 단계를 실행합니다./Run a pipeline step in a worker process or as a subprocess."""
+
+    if os.environ.get("AUTOSORT_USE_SUBPROCESS") == "1":
+        return run_subprocess(cmd, output_queue)
+    return run_in_process(cmd, output_queue)
+
+
 def stream_pipeline(
     roots: Sequence[str],
     mode: str,
@@ -124,7 +298,7 @@ def stream_pipeline(
     def worker() -> None:
         for step in PIPELINE_STEPS:
             q.put(("stage", step))
-            rc = run_subprocess(build_step_command(step, roots, mode), q)
+            rc = run_step(build_step_command(step, roots, mode), q)
             q.put(("result", step, rc))
             if rc != 0:
                 q.put(("failed", step, rc))
@@ -133,15 +307,27 @@ def stream_pipeline(
 
     threading.Thread(target=worker, daemon=True).start()
 
-    collected: list[str] = []
+    collected = LogBuffer()
+    finished = False
     with status_box as box:
         box.update(label="Running pipeline", state="running")
-        while True:
+        while not finished:
             try:
-                item = q.get(timeout=0.05)
+                batch = [q.get(timeout=0.05)]
             except queue.Empty:
                 continue
-            if isinstance(item, tuple):
+            # 대기 중인 항목을 한 번에 비우고 한 번만 렌더링합니다./Drain pending items, render once.
+            while True:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            log_dirty = False
+            for item in batch:
+                if not isinstance(item, tuple):
+                    collected.append(str(item))
+                    log_dirty = True
+                    continue
                 tag = item[0]
                 if tag == "stage":
                     box.write(f"🚀 {item[1]} started")
@@ -156,26 +342,56 @@ def stream_pipeline(
                     box.update(label="Pipeline failed", state="error")
                     box.write(f"❌ {step} failed (rc={rc})")
                     st.error("파이프라인이 실패했습니다. 로그를 확인하세요.")
+                    finished = True
                     break
                 elif tag == "done":
                     progress_bar.progress(100)
                     box.update(label="Pipeline finished", state="complete")
                     st.toast("Pipeline completed", icon="✅")
+                    finished = True
                     break
-            else:
-                collected.append(str(item))
-                if len(collected) > 800:
-                    collected[:] = collected[-800:]
-                log_placeholder.code("\n".join(collected), language="bash")
-            time.sleep(0.01)
+            if log_dirty:
+                log_placeholder.code(collected.text(), language="bash")
+
+
+def _artifact_key(path: Path) -> tuple[str, int, int] | None:
+    """경로·mtime·크기 캐시 키를 만듭니다./Build path/mtime/size cache key."""
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_records(path_str: str, mtime_ns: int, size: int) -> tuple[FileRecord, ...]:
+    """변경되지 않은 스코어 파일 파싱을 재사용합니다./Reuse parsed records for unchanged files."""
+
+    return tuple(load_records(Path(path_str)))
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_journal(path_str: str, mtime_ns: int, size: int) -> tuple[dict[str, object], ...]:
+    """변경되지 않은 저널 파싱을 재사용합니다./Reuse parsed journal for unchanged files."""
+
+    return tuple(load_journal(Path(path_str)))
+
+
+def load_journal_entries(journal_path: Path) -> list[dict[str, object]]:
+    """캐시된 저널 항목을 반환합니다./Return cached journal entries."""
+
+    key = _artifact_key(journal_path)
+    return list(_cached_journal(*key)) if key is not None else []
 
 
 def load_scores_dataframe(scores_path: Path) -> pd.DataFrame:
     """스코어 파일을 데이터프레임으로 로드합니다./Load scores as DataFrame."""
 
-    if not scores_path.exists():
+    key = _artifact_key(scores_path)
+    if key is None:
         return pd.DataFrame(columns=["path", "bucket", "size", "ext"])
-    records = load_records(scores_path)
+    records = _cached_records(*key)
     rows = [
         {
             "path": rec.path,
@@ -190,6 +406,17 @@ def load_scores_dataframe(scores_path: Path) -> pd.DataFrame:
     return pd.DataFrame(rows)
 
 
+def load_dashboard_data(
+    scores_path: Path, journal_path: Path
+) -> tuple[pd.DataFrame, list[dict[str, object]]]:
+    """스코어와 저널을 병렬로 로드합니다./Load scores and journal concurrently."""
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        scores_future = executor.submit(load_scores_dataframe, scores_path)
+        journal_future = executor.submit(load_journal_entries, journal_path)
+        return scores_future.result(), journal_future.result()
+
+
 def render_summary(df: pd.DataFrame, journal: list[dict[str, object]], mode: str) -> None:
     """상단 요약 카드를 렌더링합니다./Render KPI summary cards."""
 
@@ -206,12 +433,40 @@ def render_summary(df: pd.DataFrame, journal: list[dict[str, object]], mode: str
     st.info(f"마지막 작업 {timestamp} · 총 작업 {summary.total_operations}개")
 
 
+def _entry_ts(entry: dict[str, object]) -> float:
+    """숫자가 아닌 ts는 0으로 처리합니다./Coerce ts to float, 0 when not numeric."""
+
+    try:
+        return float(cast(float | int | str, entry.get("ts") or 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _timeline_frame(journal: list[dict[str, object]]) -> pd.DataFrame:
+    """저널 누적 타임라인을 벡터화해 생성합니다./Build cumulative journal timeline vectorized."""
+
+    ts = np.fromiter(map(_entry_ts, journal), dtype=np.float64, count=len(journal))
+    ts = ts[ts > 0]
+    # 초 단위 타임스탬프도 허용합니다./Accept second-based timestamps as well.
+    ts = np.where(ts < 1e12, ts * 1000.0, ts)
+    ts.sort()
+    return pd.DataFrame(
+        {
+            "ts_dt": pd.to_datetime(ts, unit="ms"),
+            "total": np.arange(1, len(ts) + 1, dtype=np.int64),
+        }
+    )
+
+
 def render_charts(df: pd.DataFrame, journal: list[dict[str, object]]) -> None:
     """시각화 섹션을 렌더링합니다./Render visualization section."""
 
     if df.empty:
         st.warning("시각화를 위해 먼저 파이프라인을 실행하세요./Run the pipeline to see charts.")
         return
+    # 차트가 필요할 때만 altair를 로드합니다./Import altair only when charts render.
+    import altair as alt
+
     col1, col2 = st.columns(2)
     bucket_counts = df.groupby("bucket")["path"].count().reset_index(name="count")
     pie = (
@@ -228,8 +483,7 @@ def render_charts(df: pd.DataFrame, journal: list[dict[str, object]]) -> None:
             alt.Chart(bar).mark_bar().encode(x="code", y="count", tooltip=["code", "count"]),
             use_container_width=True,
         )
-        journal_df["ts_dt"] = pd.to_datetime(journal_df["ts"], unit="ms")
-        line = journal_df.sort_values("ts_dt").assign(total=lambda d: range(1, len(d) + 1))
+        line = _timeline_frame(journal)
         st.altair_chart(
             alt.Chart(line)
             .mark_line()
@@ -242,17 +496,29 @@ def render_file_browser(df: pd.DataFrame, filters: dict[str, str]) -> None:
     """검색과 필터 UI를 렌더링합니다./Render search and filtering UI."""
 
     st.subheader("파일 검색 Search files")
-    search = filters.get("search", "").lower()
+    search = filters.get("search", "")
     bucket = filters.get("bucket", "")
     ext = filters.get("ext", "")
-    filtered = df
+    mask = np.ones(len(df), dtype=bool)
     if search:
-        filtered = filtered[filtered["path"].str.lower().str.contains(search)]
+        # 정규식 없이 대소문자 무시 부분 일치로 검색합니다./Plain case-insensitive substring match.
+        mask &= df["path"].str.contains(search, case=False, na=False, regex=False).to_numpy()
     if bucket:
-        filtered = filtered[filtered["bucket"] == bucket]
+        mask &= (df["bucket"] == bucket).to_numpy()
     if ext:
-        filtered = filtered[filtered["ext"] == ext]
-    st.dataframe(filtered.sort_values("bucket"), use_container_width=True, height=320)
+        mask &= (df["ext"] == ext).to_numpy()
+    hits = np.flatnonzero(mask)
+    # 버킷 열만 정렬해 순서를 정한 뒤 자릅니다./Order by bucket first, then truncate.
+    order = df["bucket"].iloc[hits].reset_index(drop=True).sort_values(kind="stable").index
+    hits = hits[order.to_numpy()]
+    if len(hits) > MAX_BROWSER_ROWS:
+        show_all = st.checkbox(f"모두 표시 Show all {len(hits):,} matches", key="browser_show_all")
+        if not show_all:
+            st.caption(
+                f"{len(hits):,}개 중 {MAX_BROWSER_ROWS}개 표시 Showing first {MAX_BROWSER_ROWS}"
+            )
+            hits = hits[:MAX_BROWSER_ROWS]
+    st.dataframe(df.take(hits), use_container_width=True, height=320)
 
 
 def render_logs(journal: list[dict[str, object]]) -> None:
@@ -290,13 +556,16 @@ def sidebar_controls(df: pd.DataFrame) -> tuple[list[str], str, bool]:
         st.divider()
         st.caption("필터 Filters")
         search = st.text_input("검색 Search")
-        bucket_options = (
-            sorted({row for row in df["bucket"].dropna().unique()}) if not df.empty else []
+        # unique()가 이미 중복을 제거하므로 병합 후 한 번만 정렬합니다./Sort once after merging.
+        options: dict[str, None] = (
+            dict.fromkeys(df["bucket"].dropna().unique()) if not df.empty else {}
         )
-        schema_options = {
-            Path(p).parts[0].rstrip("/") for p in load_schema_config(SCHEMA_PATH).schema_paths
-        }
-        merged_options = sorted(set(bucket_options) | schema_options)
+        options.update(
+            dict.fromkeys(
+                Path(p).parts[0].rstrip("/") for p in load_schema_config(SCHEMA_PATH).schema_paths
+            )
+        )
+        merged_options = sorted(options)
         bucket = st.selectbox("버킷 Bucket", options=[""] + merged_options)
         ext = st.text_input("확장자 Extension", help="예: .py")
     st.session_state["filters"] = {"search": search, "bucket": bucket, "ext": ext}
@@ -309,8 +578,7 @@ def main() -> None:
     st.set_page_config(
         page_title="Project Autosort", layout="wide", initial_sidebar_state="expanded"
     )
-    scores_df = load_scores_dataframe(CACHE / "scores.json")
-    journal_entries = load_journal(CACHE / "journal.jsonl")
+    scores_df, journal_entries = load_dashboard_data(CACHE / "scores.json", CACHE / "journal.jsonl")
     roots, mode, trigger = sidebar_controls(scores_df)
 
     st.title("Project Autosort Dashboard")
@@ -326,8 +594,9 @@ def main() -> None:
             st.error("최소 한 개의 루트 경로가 필요합니다./At least one root path is required.")
         else:
             stream_pipeline(roots, mode, status_box, progress, live_log)
-            scores_df = load_scores_dataframe(CACHE / "scores.json")
-            journal_entries = load_journal(CACHE / "journal.jsonl")
+            scores_df, journal_entries = load_dashboard_data(
+                CACHE / "scores.json", CACHE / "journal.jsonl"
+            )
 
     render_summary(scores_df, journal_entries, mode)
     render_charts(scores_df, journal_entries)
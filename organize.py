@@ -8,8 +8,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal, Sequence, cast
 
-import yaml
-
 from scan import FileRecord
 from utils import (
     JournalRecord,
@@ -17,6 +15,7 @@ from utils import (
     blake3_path_hash,
     ensure_directory,
     now_ms,
+    read_yaml,
 )
 
 DEFAULT_SCHEMA_PATHS: tuple[str, ...] = (
@@ -47,7 +46,7 @@ def load_schema_config(path: Path | None) -> OrganizeConfig:
     mode: Literal["move", "copy"] = "move"
     conflict: Literal["version", "skip", "overwrite"] = "version"
     if path and path.exists():
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = read_yaml(path)
         if isinstance(data, dict):
             if isinstance(data.get("structure"), list) and data["structure"]:
                 schema_paths = [str(item) for item in data["structure"]]
@@ -62,11 +61,18 @@ def load_schema_config(path: Path | None) -> OrganizeConfig:
     )
 
 
-def ensure_schema(base: Path, schema_paths: Sequence[str]) -> None:
+def ensure_schema(
+    base: Path, schema_paths: Sequence[str], made_dirs: set[Path] | None = None
+) -> None:
     """프로젝트 하위 스키마를 생성합니다./Create project sub-directories."""
 
     for relative in schema_paths:
-        ensure_directory((base / relative).resolve())
+        directory = (base / relative).resolve()
+        if made_dirs is not None:
+            if directory in made_dirs:
+                continue
+            made_dirs.add(directory)
+        ensure_directory(directory)
 
 
 def _versioned_name(dst_dir: Path, name: str, suffix: str) -> Path:
@@ -111,6 +117,9 @@ def organize_projects(
     """프로젝트별 파일을 정리합니다./Organize files by project."""
 
     ensure_directory(config.target_root)
+    # 이번 실행에서 만든 폴더만 기억해 반복 mkdir을 건너뜁니다./
+    # Remember directories made during this run to skip repeated mkdir calls.
+    made_dirs: set[Path] = set()
     by_path = {record.path: record for record in scored_records}
     journal_entries: list[JournalRecord] = []
     raw_projects = projects.get("projects", [])
@@ -123,8 +132,10 @@ def organize_projects(
         label = project.get("project_label") or project.get("project_id") or "misc"
         label = str(label)
         base = config.target_root / label
-        ensure_directory(base)
-        ensure_schema(base, config.schema_paths)
+        if base not in made_dirs:
+            ensure_directory(base)
+            made_dirs.add(base)
+        ensure_schema(base, config.schema_paths, made_dirs)
         raw_doc_ids = project.get("doc_ids", [])
         doc_ids = [str(p) for p in raw_doc_ids] if isinstance(raw_doc_ids, Sequence) else []
         for path_str in doc_ids:
@@ -137,7 +148,9 @@ def organize_projects(
             record = by_path.get(str(src))
             bucket = record.bucket if record and record.bucket else "misc"
             dst_dir = base / bucket
-            ensure_directory(dst_dir)
+            if dst_dir not in made_dirs:
+                ensure_directory(dst_dir)
+                made_dirs.add(dst_dir)
             dst_path = dst_dir / src.name
             if dst_path.exists():
                 if config.conflict == "skip":
@@ -4,16 +4,19 @@
 Project Autosort — One-File Edition
 - scan → rules → cluster(--project-mode local|gpt) → organize(move, version) → report → (rollback)
 - 중복 파일은 모두 보존: name__{blake7}.ext
-- GPT 모드: safe_id(sha256(path)) + 메타만 전송 → safe_map.json로 로컬 역매핑 (경로/원문 비전송)
+- GPT 모드: safe_id(sha256(path)) + 메타만 전송 → safe_map.jsonl로 로컬 역매핑 (경로/원문 비전송)
 Usage (PowerShell):
   python proj_autosort.py run --paths "C:\HVDC PJT" --paths "C:\cursor-mcp" --target "C:\PROJECTS_STRUCT" --project-mode local
   python proj_autosort.py run --paths "C:\HVDC PJT" --paths "C:\cursor-mcp" --target "C:\PROJECTS_STRUCT" --project-mode gpt --openai-key sk-xxxx
   python proj_autosort.py rollback --journal .cache\journal.jsonl
 """
 
-import os, re, sys, json, time, hashlib, shutil, mimetypes, math
+import os, re, sys, json, time, hashlib, shutil, mimetypes, math, sqlite3
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import repeat
+from collections import Counter
 import argparse
 
 # ---------- small deps (optional) ----------
@@ -21,11 +24,15 @@ try:
     import blake3  # pip install blake3
 except Exception:
     blake3 = None
+try:
+    import orjson  # pip install orjson (빠른 JSON 직렬화)
+except Exception:
+    orjson = None
 # local clustering (optional). If missing and project-mode=local, we fallback to naive path grouping
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.cluster import KMeans, DBSCAN
-    from sklearn.metrics.pairwise import cosine_similarity
+    from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer, TfidfTransformer
+    from sklearn.pipeline import make_pipeline
+    from sklearn.cluster import KMeans, MiniBatchKMeans, DBSCAN
     SKLEARN_OK = True
 except Exception:
     SKLEARN_OK = False
@@ -51,50 +58,147 @@ def blake7_of_file(p: Path) -> str:
             for ch in iter(lambda: f.read(1024 * 1024), b""):
                 h.update(ch)
         return h.hexdigest()[:7]
-    h = blake3.blake3()
-    with open(p, "rb") as f:
-        for ch in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(ch)
-    return h.hexdigest()[:7]
+    b3 = blake3.blake3()
+    try:
+        b3.update_mmap(p)  # 파일 매핑 + 네이티브 SIMD, 파이썬 청크 루프 없음
+    except (OSError, ValueError, AttributeError):
+        b3 = blake3.blake3()  # mmap 불가(특수 파일/구버전) → 기존 청크 루프
+        with open(p, "rb") as f:
+            for ch in iter(lambda: f.read(1024 * 1024), b""):
+                b3.update(ch)
+    return b3.hexdigest()[:7]
+
+def copy_hash_to_temp(src: Path, dst_dir: Path) -> tuple:
+    """src 를 한 번만 읽으며 해시 + dst_dir 임시파일 복사 → (h7, tmp). 다른 볼륨 move 용"""
+    h = blake3.blake3() if blake3 is not None else hashlib.sha256()
+    tmp = dst_dir / f".{src.name}.{os.getpid()}.part"
+    try:
+        with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+            buf = bytearray(1024 * 1024); view = memoryview(buf)
+            while True:
+                n = fsrc.readinto(buf)
+                if not n: break
+                h.update(view[:n]); fdst.write(view[:n])
+        shutil.copystat(src, tmp)
+    except BaseException:
+        tmp.unlink(missing_ok=True); raise
+    return h.hexdigest()[:7], tmp
+
+def same_device(src: Path, dst_dir: Path) -> bool:
+    try: return src.stat().st_dev == dst_dir.stat().st_dev
+    except OSError: return False
+
+def json_bytes(obj: Any) -> bytes:
+    # indent 없는 UTF-8 바이트 (orjson 우선)
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def json_loads(b: bytes) -> Any:
+    return orjson.loads(b) if orjson is not None else json.loads(b)
+
+def jsonl_line(obj: Any) -> bytes:
+    return json_bytes(obj) + b"\n"
+
+def dump_json(path: Path, obj: Any) -> None:
+    Path(path).write_bytes(json_bytes(obj))
+
+def write_jsonl(path: Path, rows) -> None:
+    # 한 줄 = 한 레코드, indent 없이 바이너리로 기록
+    with open(path, "wb") as f:
+        f.writelines(jsonl_line(r) for r in rows)
 
 def normalize_label(s: str) -> str:
     s = s.lower().strip()
     s = re.sub(r"[^a-z0-9]+", "_", s)
     return s.strip("_") or "misc"
 
+HASHING_MIN_DOCS = 2000  # cluster_local: 이 문서 수 이상이면 HashingVectorizer 사용
+HASHING_FEATURES = 2**15  # 더 크면 KMeans 중심(밀집 k×d) 계산이 비싸짐
+TFIDF_PRUNE_MIN_DOCS = 100  # 이 이상이면 min_df=2 / max_df=0.9 적용
+MINIBATCH_MIN_DOCS = 10000  # 이 미만은 전체 KMeans 가 더 빠름
 DEFAULT_HINTS = ["hvdc", "warehouse", "ontology", "mcp", "cursor", "layoutapp", "ldg", "logi", "stow"]
 
 # ========= 1) scan =========
-def scan_paths(roots: List[str], sample_bytes: int = 4096) -> List[Dict[str, Any]]:
-    items = []
+def iter_file_entries(root: str):
+    """os.walk 순서 그대로 파일 DirEntry 를 내보냄 (scandir 스택, 파일당 stat 캐시 재사용)"""
+    base = str(Path(root))
+    stack = ["" if base == "." else base]  # Path(dp)/fn 과 같은 경로 문자열 유지
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d or ".") as it:
+                entries = list(it)
+        except OSError:
+            continue  # os.walk 기본 onerror 와 동일하게 무시
+        subdirs = []
+        for e in entries:
+            try:
+                is_dir = e.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                yield (os.path.join(d, e.name) if d else e.name), e
+            elif not e.is_symlink():  # followlinks=False
+                subdirs.append(os.path.join(d, e.name) if d else e.name)
+        stack.extend(reversed(subdirs))
+
+def file_ext(name: str) -> str:
+    ext = os.path.splitext(name)[1]
+    return "" if ext == "." else ext  # Path.suffix 규칙
+
+TEXT_EXTS = (".md",".txt",".py",".json",".yml",".yaml",".cfg",".ini",".toml",".csv")
+# 확실한 바이너리 → mimetypes 추측도 생략, 샘플 읽기 없음
+BINARY_EXTS = frozenset((".zip",".7z",".tar",".gz",".png",".jpg",".jpeg",".pdf",".xlsx",".xls",".parquet",".pyc",".so",".dll",".exe",".bin"))
+HINT_MAX_BYTES = 4_000_000  # 이보다 큰 파일은 샘플 생략 (로그/덤프 → 군집 라벨에 도움 안 됨)
+
+def is_textlike(fn: str, ext: str) -> bool:
+    if ext in BINARY_EXTS:
+        return False
+    mime, _ = mimetypes.guess_type(fn)
+    return bool(mime) and (mime.startswith("text") or ext.endswith(TEXT_EXTS))
+
+def read_head(path: str, sample_bytes: int) -> str:
+    try:
+        with open(path, "rb") as f:
+            return f.read(sample_bytes).decode("utf-8", errors="ignore")
+    except Exception:
+        return ""
+
+def read_heads(recs: List[Dict[str, Any]], sample_bytes: int):
+    return [(r, read_head(r["path"], sample_bytes)) for r in recs]
+
+def scan_paths(roots: List[str], sample_bytes: int = 4096, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    items, pending = [], []
     for root in roots:
-        for dp, _, files in os.walk(root):
-            for fn in files:
-                p = Path(dp) / fn
-                try:
-                    st = p.stat()
-                    rec = {
-                        "path": str(p),
-                        "safe_id": sha256_str(str(p)),  # 경로 기반 safe id (세션 내 안정)
-                        "name": fn,
-                        "ext": p.suffix.lower(),
-                        "size": st.st_size,
-                        "mtime": int(st.st_mtime),
-                    }
-                    # lightweight snippet only for text-like
-                    mime, _ = mimetypes.guess_type(p.name)
-                    if mime and (mime.startswith("text") or any(p.suffix.lower().endswith(x) for x in (".md",".txt",".py",".json",".yml",".yaml",".cfg",".ini",".toml",".csv"))):
-                        try:
-                            with open(p, "rb") as f:
-                                head = f.read(sample_bytes)
-                            rec["hint"] = head.decode("utf-8", errors="ignore")
-                        except Exception:
-                            rec["hint"] = ""
-                    else:
-                        rec["hint"] = ""
-                    items.append(rec)
-                except Exception as e:
-                    items.append({"path": str(p), "error": str(e)})
+        for path, ent in iter_file_entries(root):
+            fn = ent.name
+            try:
+                st = ent.stat()  # DirEntry 캐시 (Windows는 추가 syscall 없음)
+                ext = file_ext(fn).lower()
+                rec = {
+                    "path": path,
+                    "safe_id": sha256_str(path),  # 경로 기반 safe id (세션 내 안정)
+                    "name": fn,
+                    "ext": ext,
+                    "size": st.st_size,
+                    "mtime": int(st.st_mtime),
+                    "hint": "",
+                }
+                # lightweight snippet only for text-like (바이너리는 열지 않음)
+                if st.st_size < HINT_MAX_BYTES and is_textlike(fn, ext):
+                    pending.append(rec)
+                items.append(rec)
+            except Exception as e:
+                items.append({"path": path, "error": str(e)})
+    # 샘플 읽기는 디스크 대기가 대부분 → 스레드 풀로 겹쳐서 읽음 (64개씩 묶어 작업 오버헤드 절감)
+    if pending:
+        workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        chunks = [pending[i:i + 64] for i in range(0, len(pending), 64)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for chunk in pool.map(read_heads, chunks, repeat(sample_bytes)):
+                for rec, hint in chunk:
+                    rec["hint"] = hint
     return items
 
 # ========= 2) rules (shallow bucket tags) =========
@@ -110,19 +214,58 @@ RULES = [
     ("archive",   r"old|backup|_bak|_copy|v\d+"),
 ]
 
+# 규칙 사전 컴파일: 본문이 lower() 이므로 소문자 패턴을 re.I 없이 검사(리터럴 접두 검색 유지),
+# re.I 에서만 일치하는 ı/ſ 는 본문에서 i/s 로 접음. 규칙 우선순위 유지를 위해 단일 alternation 대신
+# 규칙 순서대로, 최상위 | 대안은 나눠서 검사
+CASE_FOLD = str.maketrans({"\u0131": "i", "\u017f": "s"})
+
+def _lower_pattern(pat: str) -> str:
+    return re.sub(r"\\.|[A-Z]", lambda m: m.group(0) if m.group(0)[0] == "\\" else m.group(0).lower(), pat)
+
+def _split_alternatives(pat: str) -> List[str]:
+    out, depth, start, i = [], 0, 0, 0
+    while i < len(pat):
+        ch = pat[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "(": depth += 1
+        elif ch == ")": depth -= 1
+        elif ch == "|" and depth == 0:
+            out.append(pat[start:i]); start = i + 1
+        i += 1
+    out.append(pat[start:])
+    return out
+
+RULES_COMPILED = [(b, [re.compile(alt).search for alt in _split_alternatives(_lower_pattern(pat))]) for b, pat in RULES]
+
+# 확장자만으로 결정되는 버킷 (RULES 의 \.ext$ 대안과 동일) → 정규식/본문 조합 전에 dict 조회
+EXT_BUCKET = {
+    ".py": "src",
+    ".ps1": "scripts", ".bat": "scripts",
+    ".md": "docs",
+    ".yml": "configs", ".yaml": "configs", ".toml": "configs", ".ini": "configs", ".json": "configs", ".cfg": "configs",
+    ".csv": "data", ".xlsx": "data", ".xls": "data", ".parquet": "data",
+    ".ipynb": "notebooks",
+}
+
 def apply_rules(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    def bucket_of(name: str, path: str, hint: str) -> str:
-        text = f"{name} {path} {hint}".lower()[:8000]
-        for b, pat in RULES:
-            if re.search(pat, text, re.I):
-                return b
+    def bucket_of(name: str, path: str, hint: str, ext: Optional[str] = None) -> str:
+        b = EXT_BUCKET.get(file_ext(name).lower() if ext is None else ext)
+        if b:
+            return b
+        text = f"{name} {path} {hint}".lower()[:8000].translate(CASE_FOLD)
+        for b, searches in RULES_COMPILED:
+            for search in searches:
+                if search(text):
+                    return b
         return "tmp"
     out = []
     for it in items:
         if "error" in it:
             it["bucket"] = "archive"
         else:
-            it["bucket"] = bucket_of(it["name"], it["path"], it.get("hint", ""))
+            it["bucket"] = bucket_of(it["name"], it["path"], it.get("hint", ""), it.get("ext"))
         out.append(it)
     return out
 
@@ -158,6 +301,18 @@ RULES
 - Confidence 0.50–0.95.
 """
 
+def _multilevel_init(X, k: int, eps: float = 0.2, rng=None):
+    """다단계 초기화: max(k, eps·n) 행을 표본 추출해 재귀적으로 군집, 그 중심을 상위 단계 init 으로 사용"""
+    import numpy as np
+    rng = rng if rng is not None else np.random.default_rng(42)
+    n = X.shape[0]
+    m = max(k, int(eps * n))
+    if m >= n or n <= 50 * k:
+        return KMeans(n_clusters=k, n_init="auto", random_state=42).fit(X).cluster_centers_
+    sample = X[np.sort(rng.choice(n, m, replace=False))]
+    centers = _multilevel_init(sample, k, eps, rng)
+    return KMeans(n_clusters=k, init=centers, n_init=1).fit(sample).cluster_centers_
+
 def cluster_local(items: List[Dict[str, Any]], hints=DEFAULT_HINTS) -> Dict[str, Any]:
     # If sklearn missing, fallback to naive grouping by top-level dir name
     if not SKLEARN_OK or len(items) < 3:
@@ -179,9 +334,19 @@ def cluster_local(items: List[Dict[str, Any]], hints=DEFAULT_HINTS) -> Dict[str,
         docs.append(txt)
         paths.append(it["path"])
 
-    vect = TfidfVectorizer(max_features=20000, ngram_range=(1,2))
-    X = vect.fit_transform(docs)
+    import numpy as np
     n = len(docs)
+    if n >= HASHING_MIN_DOCS:
+        # 대규모: 어휘 사전 없이 해시 특징 → 메모리 고정, 사전 구축 비용 없음 (float32: 밀집 중심 2^15열 절반)
+        vect = make_pipeline(HashingVectorizer(n_features=HASHING_FEATURES, ngram_range=(1,2), alternate_sign=False, norm=None, dtype=np.float32), TfidfTransformer())
+        X = vect.fit_transform(docs)
+    else:
+        # 1문서 전용/거의 모든 문서 공통 용어 제거 → X 의 nnz 감소 (소규모는 어휘가 비지 않도록 유지)
+        prune = n >= TFIDF_PRUNE_MIN_DOCS
+        try:
+            X = TfidfVectorizer(max_features=20000, ngram_range=(1,2), min_df=2 if prune else 1, max_df=0.9 if prune else 1.0).fit_transform(docs)
+        except ValueError:  # 가지치기 후 남는 용어 없음
+            X = TfidfVectorizer(max_features=20000, ngram_range=(1,2)).fit_transform(docs)
     k = max(2, min(12, int(math.sqrt(n))))
 
     if n <= 20:
@@ -190,29 +355,34 @@ def cluster_local(items: List[Dict[str, Any]], hints=DEFAULT_HINTS) -> Dict[str,
         if (labels == -1).all():
             km = KMeans(n_clusters=min(k, n), n_init="auto", random_state=42)
             labels = km.fit_predict(X)
+    elif n >= MINIBATCH_MIN_DOCS:
+        # 대규모: 다단계 표본 군집으로 초기 중심을 잡고 미니배치 SGD 중심 갱신 (전체 행렬 반복 스캔 없음)
+        init = _multilevel_init(X, min(k, n))
+        km = MiniBatchKMeans(n_clusters=min(k, n), init=init, n_init=1, batch_size=min(1024, n), random_state=42, reassignment_ratio=0.01)
+        labels = km.fit_predict(X)
     else:
         km = KMeans(n_clusters=min(k, n), n_init="auto", random_state=42)
         labels = km.fit_predict(X)
 
     from collections import defaultdict
-    groups = defaultdict(list)
-    for pth, lab in zip(paths, labels):
-        groups[int(lab)].append(pth)
+    members: Dict[int, List[int]] = defaultdict(list)
+    for i, lab in enumerate(labels):
+        members[int(lab)].append(i)  # 인덱스로 보관 → paths.index() O(n) 조회 없음
 
     # representative-based label + confidence
     try:
-        import numpy as np
-        from sklearn.metrics.pairwise import cosine_similarity
-        csim = cosine_similarity(X)
+        X = X.tocsr()
         projects = []
-        for gid, doc_ids in groups.items():
+        for gid, idxs in members.items():
+            doc_ids = [paths[i] for i in idxs]
             if gid == -1:
                 projects.append({"project_id":"misc_noise","project_label":"misc_noise","doc_ids":doc_ids,"role_bucket_map":{},"confidence":0.55,"reasons":["dbscan_noise"]})
                 continue
-            idxs = [paths.index(p) for p in doc_ids]
-            sub = csim[np.ix_(idxs, idxs)]
-            avg_sim = sub.mean(axis=1) if sub.size else 0.6
-            rep_idx = idxs[int(np.argmax(avg_sim))] if sub.size else idxs[0]
+            # 행이 L2 정규화돼 있으므로 평균 코사인 유사도 = Xg · (Xg 행 합) / m
+            # → n×n 밀집 행렬 없이 군집별 O(nnz)
+            Xg = X[idxs]
+            avg_sim = np.asarray(Xg @ np.asarray(Xg.sum(axis=0)).ravel()).ravel() / len(idxs)
+            rep_idx = idxs[int(np.argmax(avg_sim))]
             rep_txt = docs[rep_idx].lower()
             cand = []
             for h in hints:
@@ -220,55 +390,85 @@ def cluster_local(items: List[Dict[str, Any]], hints=DEFAULT_HINTS) -> Dict[str,
             for b in ["src","scripts","tests","docs","reports","configs","data","notebooks"]:
                 if b in rep_txt: cand.append(b)
             label = normalize_label("_".join(cand[:3]) or Path(doc_ids[0]).parent.name)
-            conf = float(avg_sim.max()) if sub.size else 0.65
+            conf = float(avg_sim.max())
             conf = max(0.5, min(0.95, conf))
             projects.append({"project_id":label,"project_label":label,"doc_ids":doc_ids,"role_bucket_map":{},"confidence":conf,"reasons":["tfidf_cluster"]})
         return {"projects": projects}
     except Exception:
         # safe fallback
-        return {"projects":[{"project_id":normalize_label(Path(v[0]).parent.name),"project_label":normalize_label(Path(v[0]).parent.name),"doc_ids":v,"role_bucket_map":{},"confidence":0.65,"reasons":["fallback"]} for v in groups.values()]}
+        return {"projects":[{"project_id":normalize_label(Path(paths[v[0]]).parent.name),"project_label":normalize_label(Path(paths[v[0]]).parent.name),"doc_ids":[paths[i] for i in v],"role_bucket_map":{},"confidence":0.65,"reasons":["fallback"]} for v in members.values()]}
 
 def call_openai_chat(api_key: str, safe_records: List[Dict[str, Any]]) -> Dict[str, Any]:
     # pure stdlib call
-    import urllib.request
+    import urllib.request, urllib.error
     payload = {
         "model": "gpt-4o-mini",
         "messages": [
             {"role":"system","content": SYSTEM_PROMPT},
-            {"role":"user","content": json.dumps(safe_records, ensure_ascii=False)}
+            {"role":"user","content": json_bytes(safe_records).decode("utf-8")}
         ],
         "response_format": {"type":"json_object"},
         "temperature": 0.2
     }
     req = urllib.request.Request(
         "https://api.openai.com/v1/chat/completions",
-        data=json.dumps(payload).encode("utf-8"),
+        data=json_bytes(payload),
         headers={"Content-Type":"application/json","Authorization":f"Bearer {api_key}"}
     )
-    with urllib.request.urlopen(req, timeout=90) as resp:
-        out = json.loads(resp.read().decode("utf-8"))
+    for attempt in range(GPT_RETRIES):
+        try:
+            with urllib.request.urlopen(req, timeout=90) as resp:
+                out = json.loads(resp.read().decode("utf-8"))
+            break
+        except urllib.error.HTTPError as e:
+            # 429/5xx 는 일시 오류 → 지수 백오프 후 재시도
+            if (e.code != 429 and e.code < 500) or attempt == GPT_RETRIES - 1:
+                raise
+            time.sleep(2 ** attempt)
     content = out["choices"][0]["message"]["content"]
     return json.loads(content)
 
+GPT_SHARD = 200  # 요청 1건당 SAFE 레코드 수 (컨텍스트 한도 회피)
+GPT_CONCURRENCY = 4
+GPT_RETRIES = 3
+
+def call_openai_sharded(api_key: str, safe_records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # 샤드별 요청을 스레드로 동시에 (urllib 는 블로킹 → 대기 시간만 겹침)
+    shards = [safe_records[i:i + GPT_SHARD] for i in range(0, len(safe_records), GPT_SHARD)]
+    if len(shards) <= 1:
+        return [call_openai_chat(api_key, safe_records)]
+    with ThreadPoolExecutor(max_workers=GPT_CONCURRENCY) as pool:
+        return list(pool.map(call_openai_chat, repeat(api_key), shards))
+
 def cluster_gpt(items: List[Dict[str, Any]], safe_map: Dict[str,str], api_key: str) -> Dict[str, Any]:
     safe_records = payload_safe(items)
-    data = call_openai_chat(api_key, safe_records)  # {"projects":[{..., "doc_ids":[safe_id,...]}]}
-    projects = []
-    for p in data.get("projects", []):
-        ids = p.get("doc_ids", [])
-        paths = [safe_map.get(i) for i in ids if i in safe_map]
-        if not paths:
-            continue
-        label = normalize_label(p.get("project_label") or p.get("project_id") or "misc")
-        projects.append({
-            "project_id": label,
-            "project_label": label,
-            "doc_ids": paths,
-            "role_bucket_map": p.get("role_bucket_map", {}),
-            "confidence": float(p.get("confidence", 0.7)),
-            "reasons": (p.get("reasons", []) + ["mapped_via_safe_map"])[:5]
-        })
-    return {"projects": projects}
+    results = call_openai_sharded(api_key, safe_records)  # [{"projects":[{..., "doc_ids":[safe_id,...]}]}, ...]
+    merged: Dict[str, Dict[str, Any]] = {}  # 샤드마다 같은 label 이 나오면 하나로 합침
+    for data in results:
+        for p in data.get("projects", []):
+            ids = p.get("doc_ids", [])
+            paths = [safe_map.get(i) for i in ids if i in safe_map]
+            if not paths:
+                continue
+            label = normalize_label(p.get("project_label") or p.get("project_id") or "misc")
+            conf = float(p.get("confidence", 0.7))
+            cur = merged.get(label)
+            if cur is None:
+                merged[label] = {
+                    "project_id": label,
+                    "project_label": label,
+                    "doc_ids": paths,
+                    "role_bucket_map": p.get("role_bucket_map", {}),
+                    "confidence": conf,
+                    "reasons": (p.get("reasons", []) + ["mapped_via_safe_map"])[:5]
+                }
+                continue
+            # 문서 수 가중 평균 confidence
+            n0 = len(cur["doc_ids"])
+            cur["confidence"] = (cur["confidence"] * n0 + conf * len(paths)) / (n0 + len(paths))
+            cur["doc_ids"] += paths
+            cur["role_bucket_map"] = {**p.get("role_bucket_map", {}), **cur["role_bucket_map"]}
+    return {"projects": list(merged.values())}
 
 # ========= 4) organize (move + version) =========
 DEFAULT_SCHEMA = [
@@ -285,55 +485,149 @@ def versioned_dst(dst_dir: Path, name: str, hash7: str) -> Path:
     ext  = Path(name).suffix
     return dst_dir / f"{stem}__{hash7}{ext}"
 
-def organize(projects: Dict[str, Any], scores_items: List[Dict[str, Any]], target_root: str, mode: str, conflict: str, journal_path: str, schema_dirs: List[str]):
+def cached_h7(src: Path, meta: Dict[str, Any]) -> Optional[str]:
+    """이전 실행의 h7 재사용: size, mtime(초) 가 scan 값과 같을 때만"""
+    h7 = meta.get("h7")
+    if not h7:
+        return None
+    st = src.stat()
+    if st.st_size != meta.get("size") or int(st.st_mtime) != meta.get("mtime"):
+        return None
+    return h7
+
+def load_h7_cache(scores_json: Path) -> Dict[str, tuple]:
+    """이전 scores.json → {path: (size, mtime, h7)}"""
+    try:
+        data = json.loads(scores_json.read_bytes())
+    except Exception:
+        return {}
+    return {it["path"]: (it.get("size"), it.get("mtime"), it["h7"]) for it in data if isinstance(it, dict) and it.get("h7") and "path" in it}
+
+# 실행 간 상태 (파일 메타/h7, 프로젝트) — JSON 전체 재파싱 대신 SQLite(WAL) upsert
+STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files(path TEXT PRIMARY KEY, safe_id TEXT, name TEXT, ext TEXT, size INTEGER, mtime INTEGER, hint TEXT, bucket TEXT, h7 TEXT);
+CREATE INDEX IF NOT EXISTS files_bucket ON files(bucket);
+CREATE TABLE IF NOT EXISTS projects(project_id TEXT, label TEXT, conf REAL);
+CREATE TABLE IF NOT EXISTS project_files(project_id TEXT, path TEXT);
+"""
+FILE_COLS = ("path","safe_id","name","ext","size","mtime","hint","bucket","h7")
+
+def open_state(db_path: Path) -> sqlite3.Connection:
+    con = sqlite3.connect(str(db_path))
+    con.execute("PRAGMA journal_mode=WAL"); con.execute("PRAGMA synchronous=NORMAL")
+    con.executescript(STATE_SCHEMA)
+    return con
+
+def load_h7_state(con: sqlite3.Connection) -> Dict[str, tuple]:
+    """state DB → {path: (size, mtime, h7)}"""
+    return {r[0]: r[1:] for r in con.execute("SELECT path, size, mtime, h7 FROM files WHERE h7 IS NOT NULL")}
+
+def save_state(con: sqlite3.Connection, items: List[Dict[str, Any]], projects: Dict[str, Any]):
+    # files 는 경로 기준 upsert (이전 실행 행은 h7 캐시로 유지), projects 는 이번 실행으로 교체
+    with con:
+        con.executemany(f"INSERT OR REPLACE INTO files VALUES ({','.join('?' * len(FILE_COLS))})",
+                        (tuple(it.get(c) for c in FILE_COLS) for it in items if "safe_id" in it))
+        con.execute("DELETE FROM projects"); con.execute("DELETE FROM project_files")
+        ps = projects.get("projects", [])
+        con.executemany("INSERT INTO projects VALUES (?,?,?)", ((p.get("project_id"), p.get("project_label"), p.get("confidence")) for p in ps))
+        con.executemany("INSERT INTO project_files VALUES (?,?)", ((p.get("project_id"), d) for p in ps for d in p.get("doc_ids", [])))
+
+def organize_one(src_path: str, dst_dir: Path, meta: Dict[str, Any], mode: str, conflict: str) -> Dict[str, Any]:
+    """파일 1개 해시+이동/복사 → journal 레코드 반환"""
+    src = Path(src_path)
+    if not src.exists():
+        return {"ts":now_ms(),"code":"MISS","src":str(src)}
+    ensure_dir(dst_dir)
+    tmp = None
+    try:
+        # move: 같은 볼륨은 해시 후 rename, 다른 볼륨은 해시+복사를 한 번의 읽기로
+        local = mode == "copy" or same_device(src, dst_dir)
+        h7 = cached_h7(src, meta)
+        if not h7:
+            if local: h7 = blake7_of_file(src)
+            else: h7, tmp = copy_hash_to_temp(src, dst_dir)
+            meta["h7"] = h7
+        dst = versioned_dst(dst_dir, src.name, h7)
+        if conflict == "skip" and dst.exists():
+            code="SKIP"
+        else:
+            if mode == "copy":
+                shutil.copy2(src, dst)  # sendfile 경로가 파이썬 청크 복사보다 빠름
+            elif local:
+                os.replace(src, dst)
+            else:
+                if tmp is None: _, tmp = copy_hash_to_temp(src, dst_dir)
+                os.replace(tmp, dst); tmp = None
+                src.unlink()
+            code="OK"
+        return {"ts":now_ms(),"code":code,"src":str(src),"dst":str(dst),"hash":h7}
+    except Exception as e:
+        return {"ts":now_ms(),"code":"ERR","src":str(src),"reason":str(e)}
+    finally:
+        if tmp is not None: tmp.unlink(missing_ok=True)
+
+def organize_group(tasks: List[tuple], mode: str, conflict: str) -> List[Dict[str, Any]]:
+    return [organize_one(src_path, dst_dir, meta, mode, conflict) for src_path, dst_dir, meta in tasks]
+
+def organize(projects: Dict[str, Any], scores_items: List[Dict[str, Any]], target_root: str, mode: str, conflict: str, journal_path: str, schema_dirs: List[str], workers: Optional[int] = None):
     ensure_dir(Path(target_root))
     by_path = {x["path"]: x for x in scores_items if "path" in x}
-    with open(journal_path, "a", encoding="utf-8") as log:
-        for p in projects.get("projects", []):
-            base = Path(target_root) / p["project_label"]
-            ensure_schema(base, schema_dirs)
-            for src_path in p.get("doc_ids", []):
-                src = Path(src_path)
-                if not src.exists():
-                    log.write(json.dumps({"ts":now_ms(),"code":"MISS","src":str(src)})+"\n")
-                    continue
-                meta = by_path.get(src_path, {})
-                bucket = meta.get("bucket", "tmp")
-                dst_dir = base / bucket
-                ensure_dir(dst_dir)
-                try:
-                    h7 = blake7_of_file(src)
-                    dst = versioned_dst(dst_dir, src.name, h7)
-                    if conflict == "skip" and dst.exists():
-                        code="SKIP"
-                    else:
-                        if mode == "copy":
-                            shutil.copy2(src, dst)
-                        else:
-                            shutil.move(src, dst)
-                        code="OK"
-                    log.write(json.dumps({"ts":now_ms(),"code":code,"src":str(src),"dst":str(dst),"hash":h7})+"\n")
-                except Exception as e:
-                    log.write(json.dumps({"ts":now_ms(),"code":"ERR","src":str(src),"reason":str(e)})+"\n")
+    # 계획은 순차로: 같은 파일명끼리 한 그룹 → 같은 src/같은 dst 는 원래 순서대로 한 스레드에서 처리
+    groups: Dict[str, List[tuple]] = {}
+    for p in projects.get("projects", []):
+        base = Path(target_root) / p["project_label"]
+        ensure_schema(base, schema_dirs)
+        for src_path in p.get("doc_ids", []):
+            meta = by_path.get(src_path, {})
+            groups.setdefault(Path(src_path).name, []).append((src_path, base / meta.get("bucket", "tmp"), meta))
+    workers = workers or min(16, (os.cpu_count() or 1) * 2)
+    with open(journal_path, "ab") as log, ThreadPoolExecutor(max_workers=workers) as pool:
+        batch: List[bytes] = []
+        def journal(rec: Dict[str, Any]):
+            batch.append(jsonl_line(rec))
+            if len(batch) >= 256:  # 256줄씩 모아 한 번에 append
+                log.write(b"".join(batch)); batch.clear()
+        try:
+            # 그룹을 ~64개 파일 단위로 묶어 제출 (작업당 오버헤드 절감)
+            chunks, cur = [], []
+            for tasks in groups.values():
+                cur.extend(tasks)
+                if len(cur) >= 64:
+                    chunks.append(cur); cur = []
+            if cur: chunks.append(cur)
+            futs = [pool.submit(organize_group, tasks, mode, conflict) for tasks in chunks]
+            for fut in as_completed(futs):  # journal 기록은 메인 스레드에서만
+                for rec in fut.result():
+                    journal(rec)
+        finally:
+            # 중단되더라도 이미 처리한 항목은 rollback 가능하도록 남김
+            log.write(b"".join(batch))
 
 # ========= 5) report =========
 def write_report(journal_path: str, out_html: str):
     ensure_dir(Path(out_html).parent)
     moves, errs = 0, 0
-    by_proj = {}
+    by_proj: Counter[str] = Counter()
+    codes: Counter[Any] = Counter()
     if Path(journal_path).exists():
-        for line in open(journal_path, encoding="utf-8"):
-            try:
-                j = json.loads(line)
-            except Exception:
-                continue
-            code = j.get("code")
-            if code == "OK": moves += 1
-            if code in ("ERR","MISS"): errs += 1
-            dst = j.get("dst","")
-            parts = Path(dst).parts
-            key = parts[1] if len(parts)>1 else "misc"
-            by_proj[key] = by_proj.get(key, 0) + 1
+        dir_parts: Dict[str, tuple] = {}  # dst 폴더별 Path.parts 캐시 (파일마다 Path 생성 안 함)
+        with open(journal_path, "rb", buffering=1 << 20) as f:
+            for line in f:
+                try:
+                    j = json_loads(line)
+                except Exception:
+                    continue
+                codes[j.get("code")] += 1
+                dst = j.get("dst","")
+                d, name = os.path.split(dst)
+                parts = dir_parts.get(d)
+                if parts is None:
+                    parts = dir_parts[d] = Path(d).parts
+                if len(parts) > 1: key = parts[1]
+                elif parts and name not in ("", "."): key = name  # Path(dst).parts[1] 와 동일
+                else: key = "misc"
+                by_proj[key] += 1
+        moves, errs = codes["OK"], codes["ERR"] + codes["MISS"]
     rows = "".join(f"<tr><td>{k}</td><td style='text-align:right'>{v}</td></tr>" for k,v in sorted(by_proj.items()))
     html = f"""<!doctype html><meta charset="utf-8">
 <title>Project Organize Report</title>
@@ -362,14 +656,23 @@ def rollback(journal_path: str):
     if not Path(journal_path).exists():
         print("[rollback] journal not found")
         return
-    lines = [json.loads(x) for x in open(journal_path, encoding="utf-8") if x.strip()]
-    for j in reversed(lines):
-        if j.get("code") != "OK":
-            continue
-        src, dst = j["src"], j["dst"]
-        if Path(dst).exists():
-            ensure_dir(Path(src).parent)
-            shutil.move(dst, src)
+    with open(journal_path, "rb") as f:
+        # 1차: "OK" 가 들어간 줄의 오프셋만 수집 (journal 전체를 메모리에 올리지 않음)
+        offsets, off = [], 0
+        for line in f:
+            if b'"OK"' in line:
+                offsets.append(off)
+            off += len(line)
+        # 2차: 역순으로 seek → 한 줄씩 파싱, code 재확인
+        for off in reversed(offsets):
+            f.seek(off)
+            j = json_loads(f.readline())
+            if j.get("code") != "OK":
+                continue
+            src, dst = j["src"], j["dst"]
+            if Path(dst).exists():
+                ensure_dir(Path(src).parent)
+                shutil.move(dst, src)
     print("[rollback] completed")
 
 # ========= CLI =========
@@ -397,19 +700,23 @@ def main():
         cache = Path(args.cache_dir); ensure_dir(cache)
         ensure_dir(Path(args.report).parent)
 
-        # 1) scan
+        # 1) scan (+ 이전 실행 h7 이어받기: size/mtime 동일한 파일만)
+        scores_json = cache / "scores.json"
+        state = open_state(cache / "state.db")
+        prev_h7 = load_h7_state(state) or load_h7_cache(scores_json)  # DB 가 비어 있으면 기존 scores.json 에서 이전
         items = scan_paths(args.paths, sample_bytes=args.sample_bytes)
-        scan_json = cache / "scan.json"
-        json.dump(items, open(scan_json,"w",encoding="utf-8"), ensure_ascii=False, indent=2)
+        for it in items:
+            hit = prev_h7.get(it["path"])
+            if hit and hit[0] == it.get("size") and hit[1] == it.get("mtime"):
+                it["h7"] = hit[2]
+        write_jsonl(cache / "scan.jsonl", items)
 
-        # safe_map (safe_id -> path)
+        # safe_map (safe_id -> path), JSONL: {"id":..,"path":..}
         safe_map = {it.get("safe_id"): it.get("path") for it in items if "safe_id" in it}
-        json.dump(safe_map, open(cache/"safe_map.json","w",encoding="utf-8"), ensure_ascii=False, indent=2)
+        write_jsonl(cache / "safe_map.jsonl", ({"id": k, "path": v} for k, v in safe_map.items()))
 
         # 2) rules
         items2 = apply_rules(items)
-        scores_json = cache / "scores.json"
-        json.dump(items2, open(scores_json,"w",encoding="utf-8"), ensure_ascii=False, indent=2)
 
         # 3) cluster
         if args.project_mode == "gpt":
@@ -429,11 +736,14 @@ def main():
             projects = cluster_local(items2)
 
         projects_json = cache / "projects.json"
-        json.dump(projects, open(projects_json,"w",encoding="utf-8"), ensure_ascii=False, indent=2)
+        dump_json(projects_json, projects)
 
         # 4) organize
         journal = str(cache / "journal.jsonl")
         organize(projects, items2, args.target, args.mode, args.conflict, journal, DEFAULT_SCHEMA)
+        # organize 가 채운 h7 까지 state.db 에 upsert (다음 실행의 해시 캐시), scores/projects.json 은 대시보드용
+        save_state(state, items2, projects); state.close()
+        dump_json(scores_json, items2)
 
         # 5) report
         out_html = write_report(journal, args.report)
@@ -444,4 +754,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-proj_autosort.py
\ No newline at end of file
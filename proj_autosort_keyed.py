@@ -12,7 +12,9 @@ Usage (PowerShell):
 
 import os, re, sys, json, time, hashlib, shutil, mimetypes, math
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 import argparse
 
 # ========= OPENAI API KEY CONFIGURATION =========
@@ -44,15 +46,30 @@ def ensure_dir(p: Path): p.mkdir(parents=True, exist_ok=True)
 def sha256_str(s: str) -> str:
     h = hashlib.sha256(); h.update(s.encode("utf-8", errors="ignore")); return h.hexdigest()
 
+THREADED_HASH_MIN_BYTES = 1024*1024  # below this, multithreaded blake3 is slower than single-thread
+
+HASH_BUF_BYTES = 128*1024
+
+def update_from_file(h, p: Path):
+    # one reusable buffer, readinto + memoryview → no per-chunk bytes allocation
+    buf = bytearray(HASH_BUF_BYTES); view = memoryview(buf)
+    with open(p, "rb") as f:
+        while True:
+            n = f.readinto(buf)
+            if not n: break
+            h.update(view[:n])
+    return h
+
 def blake7_of_file(p: Path) -> str:
     if blake3 is None:
-        h = hashlib.sha256()
-        with open(p, "rb") as f:
-            for ch in iter(lambda: f.read(1024*1024), b""): h.update(ch)
-        return h.hexdigest()[:7]
-    h = blake3.blake3()
-    with open(p, "rb") as f:
-        for ch in iter(lambda: f.read(1024*1024), b""): h.update(ch)
+        return update_from_file(hashlib.sha256(), p).hexdigest()[:7]
+    try:
+        # mmap + native SIMD; rayon tree hashing only pays off on large files
+        big = os.path.getsize(p) >= THREADED_HASH_MIN_BYTES
+        h = blake3.blake3(max_threads=blake3.blake3.AUTO) if big else blake3.blake3()
+        h.update_mmap(str(p))
+    except (OSError, ValueError, AttributeError):
+        h = update_from_file(blake3.blake3(), p)  # pseudo-fs / old binding → chunked loop
     return h.hexdigest()[:7]
 
 def normalize_label(s: str) -> str:
@@ -63,33 +80,61 @@ def normalize_label(s: str) -> str:
 DEFAULT_HINTS = ["hvdc","warehouse","ontology","mcp","cursor","layoutapp","ldg","logi","stow"]
 
 # ========= 1) scan =========
-def scan_paths(roots: List[str], sample_bytes: int = 4096) -> List[Dict[str, Any]]:
-    items=[]
+def iter_file_entries(root: str):
+    """os.walk order, yields (path, DirEntry) — scandir stat cache, no extra stat per file"""
+    base=str(Path(root)); stack=["" if base=="." else base]  # keep Path(dp)/fn path strings
+    while stack:
+        d=stack.pop()
+        try:
+            with os.scandir(d or ".") as it: entries=list(it)
+        except OSError: continue  # os.walk default onerror
+        subdirs=[]
+        for ent in entries:
+            try: is_dir=ent.is_dir()
+            except OSError: is_dir=False
+            if not is_dir: yield (os.path.join(d,ent.name) if d else ent.name), ent
+            elif not ent.is_symlink(): subdirs.append(os.path.join(d,ent.name) if d else ent.name)  # followlinks=False
+        stack.extend(reversed(subdirs))
+
+TEXT_EXTS={".md",".txt",".py",".json",".yml",".yaml",".cfg",".ini",".toml",".csv"}
+
+def read_heads(recs: List[Dict[str, Any]], sample_bytes: int):
+    out=[]
+    for r in recs:
+        try:
+            with open(r["path"],"rb") as f: out.append((r, f.read(sample_bytes).decode("utf-8",errors="ignore")))
+        except Exception: out.append((r, ""))
+    return out
+
+def scan_paths(roots: List[str], sample_bytes: int = 4096, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    items, pending=[], []
     for root in roots:
-        for dp,_,files in os.walk(root):
-            for fn in files:
-                p = Path(dp)/fn
-                try:
-                    st = p.stat()
-                    mime,_ = mimetypes.guess_type(p.name)
-                    rec = {
-                        "path": str(p),
-                        "safe_id": sha256_str(str(p)),  # session-stable id
-                        "name": fn,
-                        "ext": p.suffix.lower(),
-                        "size": st.st_size,
-                        "mtime": int(st.st_mtime),
-                    }
-                    if mime and (mime.startswith("text") or p.suffix.lower() in {".md",".txt",".py",".json",".yml",".yaml",".cfg",".ini",".toml",".csv"}):
-                        try:
-                            with open(p,"rb") as f: head=f.read(sample_bytes)
-                            rec["hint"]=head.decode("utf-8",errors="ignore")
-                        except Exception: rec["hint"]=""
-                    else:
-                        rec["hint"]=""
-                    items.append(rec)
-                except Exception as e:
-                    items.append({"path":str(p),"error":str(e)})
+        for path,ent in iter_file_entries(root):
+            fn=ent.name
+            try:
+                st=ent.stat()
+                mime,_=mimetypes.guess_type(fn)
+                ext=os.path.splitext(fn)[1].lower(); ext="" if ext=="." else ext  # Path.suffix rule
+                rec={
+                    "path": path,
+                    "safe_id": sha256_str(path),  # session-stable id
+                    "name": fn,
+                    "ext": ext,
+                    "size": st.st_size,
+                    "mtime": int(st.st_mtime),
+                    "hint": "",
+                }
+                if mime and (mime.startswith("text") or ext in TEXT_EXTS): pending.append(rec)
+                items.append(rec)
+            except Exception as e:
+                items.append({"path":path,"error":str(e)})
+    # head reads are I/O bound → thread pool, 64 files per task
+    if pending:
+        workers=workers or min(32,(os.cpu_count() or 1)*4)
+        chunks=[pending[i:i+64] for i in range(0,len(pending),64)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for chunk in pool.map(read_heads, chunks, repeat(sample_bytes)):
+                for rec,hint in chunk: rec["hint"]=hint
     return items
 
 # ========= 2) rules =========
@@ -172,17 +217,18 @@ def cluster_local(items: List[Dict[str, Any]], hints=DEFAULT_HINTS) -> Dict[str,
 
     from collections import defaultdict
     groups=defaultdict(list)
-    for pth,lab in zip(paths,labels):
-        groups[int(lab)].append(pth)
+    for i,lab in enumerate(labels):
+        groups[int(lab)].append(i)  # row indices → no paths.index() O(n) lookups
 
     try:
         import numpy as np
         csim=cosine_similarity(X)
         projects=[]
-        for gid,doc_ids in groups.items():
+        for gid,idxs in groups.items():
+            doc_ids=[paths[i] for i in idxs]
             if gid==-1:
                 projects.append({"project_id":"misc_noise","project_label":"misc_noise","doc_ids":doc_ids,"role_bucket_map":{},"confidence":0.55,"reasons":["dbscan_noise"]}); continue
-            idxs=[paths.index(p) for p in doc_ids]; sub=csim[np.ix_(idxs,idxs)]
+            sub=csim[np.ix_(idxs,idxs)]
             avg=sub.mean(axis=1) if sub.size else 0.6
             rep_idx=idxs[int(np.argmax(avg))] if sub.size else idxs[0]
             rep_txt=docs[rep_idx].lower(); cand=[]
@@ -195,7 +241,7 @@ def cluster_local(items: List[Dict[str, Any]], hints=DEFAULT_HINTS) -> Dict[str,
             projects.append({"project_id":label,"project_label":label,"doc_ids":doc_ids,"role_bucket_map":{},"confidence":conf,"reasons":["tfidf_cluster"]})
         return {"projects":projects}
     except Exception:
-        return {"projects":[{"project_id":normalize_label(Path(v[0]).parent.name),"project_label":normalize_label(Path(v[0]).parent.name),"doc_ids":v,"role_bucket_map":{},"confidence":0.65,"reasons":["fallback"]} for v in groups.values()]}
+        return {"projects":[{"project_id":normalize_label(Path(paths[v[0]]).parent.name),"project_label":normalize_label(Path(paths[v[0]]).parent.name),"doc_ids":[paths[i] for i in v],"role_bucket_map":{},"confidence":0.65,"reasons":["fallback"]} for v in groups.values()]}
 
 def call_openai_chat(safe_records: List[Dict[str, Any]]) -> Dict[str, Any]:
     import urllib.request
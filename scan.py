@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import mimetypes
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 
-from utils import ensure_directory, sha256_text, write_json
+from utils import ensure_directory, read_json, sha256_text, write_json
 
 
 @dataclass(slots=True)
@@ -32,13 +34,8 @@ class FileRecord:
         return {k: v for k, v in payload.items() if v is not None and v != ""}
 
 
-def _is_textual(path: Path) -> bool:
-    """텍스트 파일 여부를 추정합니다./Heuristically detect text file."""
-
-    mime, _ = mimetypes.guess_type(path.name)
-    if mime and mime.startswith("text"):
-        return True
-    return path.suffix.lower() in {
+_TEXT_SUFFIXES = frozenset(
+    {
         ".md",
         ".txt",
         ".py",
@@ -50,52 +47,100 @@ def _is_textual(path: Path) -> bool:
         ".toml",
         ".csv",
     }
+)
+
+
+def _suffix(name: str) -> str:
+    """``PurePath.suffix``와 같은 규칙의 확장자입니다./Suffix using PurePath.suffix rules."""
+
+    index = name.rfind(".")
+    if 0 < index < len(name) - 1:
+        return name[index:]
+    return ""
+
+
+def _is_textual(name: str, suffix: str) -> bool:
+    """텍스트 파일 여부를 추정합니다./Heuristically detect text file."""
+
+    mime, _ = mimetypes.guess_type(name)
+    if mime and mime.startswith("text"):
+        return True
+    return suffix.lower() in _TEXT_SUFFIXES
+
+
+def _iter_files(directory: str) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """``rglob("*")`` 순서로 파일 엔트리를 나열합니다./Yield file entries in rglob order."""
+
+    try:
+        with os.scandir(directory or ".") as iterator:
+            entries = list(iterator)
+    except OSError:
+        return
+    subdirs: list[str] = []
+    for entry in entries:
+        path = os.path.join(directory, entry.name) if directory else entry.name
+        try:
+            # 심볼릭 링크 디렉터리는 rglob처럼 따라가지 않습니다./Do not descend symlinked dirs.
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(path)
+            elif entry.is_file():
+                yield path, entry
+        except OSError:
+            continue
+    for subdir in subdirs:
+        yield from _iter_files(subdir)
+
+
+def _scan_file(path: str, entry: os.DirEntry[str], sample_bytes: int) -> FileRecord:
+    """단일 파일 메타데이터와 샘플을 수집합니다./Collect metadata and sample for one file."""
+
+    name = entry.name
+    suffix = _suffix(name)
+    try:
+        # DirEntry의 stat 결과를 재사용합니다./Reuse the DirEntry stat result.
+        stat = entry.stat()
+        hint = ""
+        if _is_textual(name, suffix):
+            try:
+                with open(path, "rb") as handle:
+                    hint = handle.read(sample_bytes).decode("utf-8", errors="ignore")
+            except OSError:
+                hint = ""
+        return FileRecord(
+            path=path,
+            safe_id=sha256_text(path),
+            name=name,
+            ext=suffix.lower(),
+            size=stat.st_size,
+            mtime=int(stat.st_mtime),
+            hint=hint,
+        )
+    except OSError as exc:
+        return FileRecord(
+            path=path,
+            safe_id=sha256_text(path),
+            name=name,
+            ext=suffix.lower(),
+            size=0,
+            mtime=0,
+            error=str(exc),
+        )
 
 
 def scan_paths(
-    paths: Sequence[Path], sample_bytes: int = 4096
+    paths: Sequence[Path], sample_bytes: int = 4096, workers: int | None = None
 ) -> tuple[list[FileRecord], dict[str, str]]:
     """경로 목록을 스캔합니다./Scan provided paths recursively."""
 
-    records: list[FileRecord] = []
-    safe_map: dict[str, str] = {}
-    for root in paths:
-        for child in root.rglob("*"):
-            if not child.is_file():
-                continue
-            try:
-                stat = child.stat()
-                safe_id = sha256_text(str(child))
-                hint = ""
-                if _is_textual(child):
-                    try:
-                        with child.open("rb") as handle:
-                            hint = handle.read(sample_bytes).decode("utf-8", errors="ignore")
-                    except OSError:
-                        hint = ""
-                record = FileRecord(
-                    path=str(child),
-                    safe_id=safe_id,
-                    name=child.name,
-                    ext=child.suffix.lower(),
-                    size=stat.st_size,
-                    mtime=int(stat.st_mtime),
-                    hint=hint,
-                )
-                records.append(record)
-                safe_map[safe_id] = str(child)
-            except OSError as exc:
-                records.append(
-                    FileRecord(
-                        path=str(child),
-                        safe_id=sha256_text(str(child)),
-                        name=child.name,
-                        ext=child.suffix.lower(),
-                        size=0,
-                        mtime=0,
-                        error=str(exc),
-                    )
-                )
+    files = [item for root in paths for item in _iter_files("" if str(root) == "." else str(root))]
+    # 지연 시간 위주 작업이므로 CPU 수보다 넉넉히 둡니다./Latency-bound: oversubscribe CPUs.
+    max_workers = workers or min(32, (os.cpu_count() or 1) * 4)
+    # 파일별 stat·샘플 I/O를 스레드로 겹칩니다./Overlap per-file stat and sample I/O in threads.
+    file_paths = [path for path, _ in files]
+    entries = [entry for _, entry in files]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        records = list(executor.map(_scan_file, file_paths, entries, repeat(sample_bytes)))
+    safe_map = {record.safe_id: record.path for record in records if not record.error}
     return records, safe_map
 
 
@@ -112,7 +157,7 @@ def emit_scan(
 def load_records(path: Path) -> list[FileRecord]:
     """스캔 결과를 로드합니다./Load scan records from disk."""
 
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = read_json(path)
     records: list[FileRecord] = []
     for item in payload:
         records.append(
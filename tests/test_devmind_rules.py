@@ -0,0 +1,181 @@
+# tests/test_devmind_rules.py
+import importlib.util
+import itertools
+import sys
+import types
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+DEVMIND_PATH = Path(__file__).resolve().parent.parent / "MACHO-GPT" / "devmind.py"
+
+
+@pytest.fixture(scope="module")
+def devmind() -> Iterator[Any]:
+    """MACHO-GPT/devmind.py를 로드 (규칙 엔진과 무관한 scan/gpt_cluster 의존성은 대체)"""
+    scan_stub = types.ModuleType("scan")
+    scan_stub.stream_paths_to_files = None  # type: ignore[attr-defined]
+    cluster_stub = types.ModuleType("gpt_cluster")
+    for name in (
+        "SimpleEncoder",
+        "serialize_min_item",
+        "pack_items_by_tokens",
+        "send_with_retry_new",
+        "bounded_gather",
+        "make_api_call_fn",
+    ):
+        setattr(cluster_stub, name, None)
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setitem(sys.modules, "scan", scan_stub)
+        patch.setitem(sys.modules, "gpt_cluster", cluster_stub)
+        spec = importlib.util.spec_from_file_location("macho_devmind", DEVMIND_PATH)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        patch.setitem(sys.modules, "macho_devmind", module)
+        spec.loader.exec_module(module)
+        yield module
+
+
+def reference_scores(engine: Any, record: Any) -> list[float]:
+    """생성 코드 도입 전의 버킷별 점수 계산 (기준 구현)"""
+    weights = engine.weights
+    name_lower = record.name.lower()
+    path_lower = record.path.lower()
+    sample_lower = record.sample.lower()
+    headings = " ".join(record.md_headings).lower()
+    imports_lower = [imp.lower() for imp in record.imports]
+    scores = []
+    for bucket in engine.buckets:
+        score = 0.0
+        if bucket.exts and record.ext.lower() in bucket.exts:
+            score += weights.name
+        for keyword in bucket.name_keywords:
+            if keyword in name_lower:
+                score += weights.name
+        for keyword in bucket.dir_keywords:
+            if keyword in path_lower or (record.dir_hint and keyword in record.dir_hint):
+                score += weights.dir
+        for keyword in bucket.title_keywords:
+            if keyword in headings:
+                score += weights.content
+        for keyword in bucket.imports:
+            if keyword in imports_lower:
+                score += weights.content
+        for keyword in bucket.code_hints:
+            if keyword in sample_lower:
+                score += weights.content
+        for mime in bucket.mimetypes:
+            if mime in record.mimetype.lower():
+                score += weights.mimetype
+        scores.append(score)
+    return scores
+
+
+def reference_classify(engine: Any, record: Any) -> str:
+    """점수 최댓값(동점이면 이름 역순 우선) 버킷, 점수가 0 이하면 tmp"""
+    ranked = sorted(
+        zip(reference_scores(engine, record), (b.name for b in engine.buckets)), reverse=True
+    )
+    top_score, top_bucket = ranked[0]
+    return top_bucket if top_score > 0 else "tmp"
+
+
+def make_records(devmind: Any) -> list[Any]:
+    """버킷 규칙의 여러 조합을 덮는 합성 레코드 생성"""
+    names = ["core_utils", "run_job", "README", "final_report", "settings", "old_v2", "misc"]
+    exts = [".py", ".md", ".txt", ".json", ".csv", ".ipynb", ".PY", ".bin"]
+    dirs = ["/repo/src", "/repo/tests", "/repo/data/raw", "/repo/docs", "/tmp/x"]
+    contents: list[tuple[list[str], list[str], str, str]] = [
+        ([], [], "", "application/octet-stream"),
+        (["Installation Guide"], [], "", "text/markdown"),
+        ([], ["pytest"], 'if __name__ == "__main__":\n    main()', "text/x-python"),
+        ([], ["Unittest", "os"], "", "text/plain"),
+    ]
+    records = []
+    for index, (name, ext, folder, content) in enumerate(
+        itertools.product(names, exts, dirs, contents)
+    ):
+        headings, imports, sample, mimetype = content
+        path = f"{folder}/{name}{ext}"
+        records.append(
+            devmind.DocumentRecord(
+                path=path,
+                safe_id=f"id{index}",
+                name=f"{name}{ext}",
+                ext=ext,
+                size=1,
+                mtime=0.0,
+                mimetype=mimetype,
+                dir_hint=folder.rsplit("/", 1)[-1],
+                imports=imports,
+                md_headings=headings,
+                sample=sample,
+            )
+        )
+    return records
+
+
+def test_generated_scorer_matches_reference(devmind: Any) -> None:
+    """기본 설정에서 생성된 _score가 기준 점수와 같아야 함"""
+    engine = devmind.RuleEngine.from_config(None)
+    for record in make_records(devmind):
+        ctx = devmind._RecordCtx.from_record(record)
+        assert engine._score(ctx) == pytest.approx(reference_scores(engine, record))
+
+
+def test_classify_paths_match_reference(devmind: Any) -> None:
+    """기본 설정에서 classify·classify_all이 기준 분류와 같아야 함"""
+    engine = devmind.RuleEngine.from_config(None)
+    records = make_records(devmind)
+    expected = [reference_classify(engine, record) for record in records]
+
+    assert [engine.classify(record) for record in records] == expected
+    assert engine.classify_all(devmind.record_columns(records)) == expected
+
+
+def test_classify_ties_and_overrides_match_reference(devmind: Any, tmp_path: Path) -> None:
+    """가중치·버킷을 덮어쓴 설정(동점 포함)에서도 기준 분류와 같아야 함"""
+    config = tmp_path / "rules.yml"
+    config.write_text(
+        "weights: {name: 2, dir: 2, content: 2, mimetype: 2}\n"
+        "buckets:\n"
+        "  alpha: {exts: ['.md'], mimetypes: ['text/']}\n"
+        "  omega: {exts: ['.md'], dir_keywords: ['docs']}\n",
+        encoding="utf-8",
+    )
+    engine = devmind.RuleEngine.from_config(config)
+    records = make_records(devmind)
+    expected = [reference_classify(engine, record) for record in records]
+
+    assert [engine.classify(record) for record in records] == expected
+    assert engine.classify_all(devmind.record_columns(records)) == expected
+
+
+def test_decisive_extensions_match_reference(devmind: Any, tmp_path: Path) -> None:
+    """확장자 단축 경로가 적용되는 설정에서도 기준 분류와 같아야 함"""
+    config = tmp_path / "rules.yml"
+    config.write_text(
+        "weights: {name: 4, dir: 3, content: 2, mimetype: 1}\n"
+        "buckets:\n"
+        "  src: {exts: ['.py']}\n"
+        "  scripts: {exts: ['.bin']}\n"
+        "  tests: {dir_keywords: ['tests']}\n"
+        "  docs: {exts: ['.md', '.txt']}\n"
+        "  reports: {}\n"
+        "  configs: {exts: ['.json', '.txt']}\n"
+        "  data: {exts: ['.csv']}\n"
+        "  notebooks: {exts: ['.ipynb']}\n"
+        "  archive: {}\n",
+        encoding="utf-8",
+    )
+    engine = devmind.RuleEngine.from_config(config)
+    records = make_records(devmind)
+    expected = [reference_classify(engine, record) for record in records]
+
+    # 여러 버킷이 공유하는 .txt는 단축 대상이 아님
+    assert engine._decisive_ext[".py"] == "src"
+    assert ".txt" not in engine._decisive_ext
+    assert [engine.classify(record) for record in records] == expected
+    assert engine.classify_all(devmind.record_columns(records)) == expected
@@ -0,0 +1,37 @@
+# tests/test_scan_threads.py
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from autosort import cli
+
+
+def test_scan_threads_option_scans_every_file(tmp_path: Path) -> None:
+    """--scan-threads 지정 시에도 모든 파일을 순서대로 스캔해야 함"""
+    root = tmp_path / "ws"
+    (root / "nested").mkdir(parents=True)
+    for index in range(5):
+        (root / f"note_{index}.md").write_text(f"# {index}", encoding="utf-8")
+    (root / "nested" / "job.py").write_text("print('x')", encoding="utf-8")
+    emit = tmp_path / "scan.json"
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "scan",
+            "--paths",
+            str(root),
+            "--emit",
+            str(emit),
+            "--safe-map",
+            str(tmp_path / "safe_map.json"),
+            "--scan-threads",
+            "3",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    names = [item["name"] for item in json.loads(emit.read_text(encoding="utf-8"))]
+    assert sorted(names[:5]) == [f"note_{index}.md" for index in range(5)]
+    assert names[5:] == ["job.py"]
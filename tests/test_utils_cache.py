@@ -0,0 +1,78 @@
+# tests/test_utils_cache.py
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import utils
+from utils import read_yaml
+
+
+def test_read_yaml_returns_isolated_copies(tmp_path: Path) -> None:
+    """캐시된 YAML 결과는 호출자 변경에 영향받지 않아야 함"""
+    config = tmp_path / "schema.yml"
+    config.write_text("structure:\n  - src/\n  - docs/\n", encoding="utf-8")
+
+    first = read_yaml(config)
+    first["structure"].append("mutated/")
+
+    assert read_yaml(config) == {"structure": ["src/", "docs/"]}
+
+
+def test_read_yaml_reloads_after_change(tmp_path: Path) -> None:
+    """파일이 변경되면 캐시를 무효화해야 함"""
+    config = tmp_path / "schema.yml"
+    config.write_text("mode: move\n", encoding="utf-8")
+    assert read_yaml(config) == {"mode": "move"}
+
+    config.write_text("mode: copy\n", encoding="utf-8")
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert read_yaml(config) == {"mode": "copy"}
+
+
+def test_read_yaml_writes_json_sidecar(tmp_path: Path) -> None:
+    """YAML 파싱 결과를 JSON 사이드카로 저장해야 함"""
+    config = tmp_path / "schema.yml"
+    config.write_text("conflict_policy: skip\n", encoding="utf-8")
+
+    assert read_yaml(config) == {"conflict_policy": "skip"}
+
+    sidecar = tmp_path / "schema.yml.json"
+    assert sidecar.exists()
+    assert json.loads(sidecar.read_text(encoding="utf-8"))["data"] == {"conflict_policy": "skip"}
+
+
+def test_read_yaml_shares_parse_for_identical_content(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """내용이 같은 설정 파일은 한 번만 파싱해야 함"""
+    calls: list[object] = []
+    original_load = utils.yaml.load
+
+    def counting_load(*args: object, **kwargs: object) -> object:
+        calls.append(args)
+        return original_load(*args, **kwargs)
+
+    monkeypatch.setattr(utils.yaml, "load", counting_load)
+    for name in ("first", "second"):
+        folder = tmp_path / name
+        folder.mkdir()
+        (folder / "rules.yml").write_text("shared_marker: 42\n", encoding="utf-8")
+        assert read_yaml(folder / "rules.yml") == {"shared_marker": 42}
+
+    assert len(calls) == 1
+
+
+def test_write_json_recreates_deleted_directory(tmp_path: Path) -> None:
+    """삭제된 출력 폴더는 다음 저장 시 다시 만들어야 함"""
+    target = tmp_path / "out" / "a.json"
+    utils.write_json(target, {"n": 1})
+    shutil.rmtree(tmp_path / "out")
+
+    utils.write_json(target, {"n": 2})
+
+    assert json.loads(target.read_text(encoding="utf-8")) == {"n": 2}
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import importlib
 import json
+import mmap
+import os
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable, cast
 
+import yaml
+
 _blake3_module: Any | None
 try:  # pragma: no cover - optional dependency
     _blake3_module = importlib.import_module("blake3")
@@ -18,6 +25,25 @@ except ModuleNotFoundError:  # pragma: no cover
 
 blake3 = cast(Any, _blake3_module)
 
+_orjson_module: Any | None
+try:  # pragma: no cover - optional dependency
+    _orjson_module = importlib.import_module("orjson")
+except ModuleNotFoundError:  # pragma: no cover
+    _orjson_module = None
+
+orjson = cast(Any, _orjson_module)
+
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# libyaml이 있으면 C 로더를 사용합니다./Prefer the libyaml C loader when available.
+YAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_YAML_CACHE_MAX = 100
+_YAML_CACHE: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+# 동일 내용의 설정 파일은 파싱 결과를 공유합니다./Identical config contents share one parse.
+_YAML_HASH_CACHE: OrderedDict[bytes, tuple[Any]] = OrderedDict()
+_YAML_CACHE_LOCK = threading.Lock()
+
 
 @dataclass(slots=True)
 class JournalRecord:
@@ -83,14 +109,85 @@ def blake3_path_hash(path: Path, chunk_size: int = 1024 * 1024) -> str:
 def read_json(path: Path) -> Any:
     """JSON 파일을 읽어 반환합니다./Read and return JSON file."""
 
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if orjson is not None and size >= MMAP_THRESHOLD_BYTES:
+            # 대용량 파일은 페이지 캐시를 직접 파싱합니다./Parse large files straight from page cache.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        raw = handle.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_yaml_with_sidecar(path: Path, mtime_ns: int, size: int) -> Any:
+    """JSON 사이드카가 유효하면 YAML 파싱을 건너뜁니다./Skip YAML parsing when the JSON sidecar is fresh."""
+
+    sidecar = path.with_name(path.name + ".json")
+    try:
+        cached = json.loads(sidecar.read_bytes())
+        if cached.get("mtime_ns") == mtime_ns and cached.get("size") == size:
+            return cached["data"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    raw = path.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    with _YAML_CACHE_LOCK:
+        hit = _YAML_HASH_CACHE.get(digest)
+        if hit is not None:
+            _YAML_HASH_CACHE.move_to_end(digest)
+    if hit is not None:
+        data = hit[0]
+    else:
+        data = yaml.load(raw.decode("utf-8"), Loader=YAML_LOADER)
+        with _YAML_CACHE_LOCK:
+            _YAML_HASH_CACHE[digest] = (data,)
+            while len(_YAML_HASH_CACHE) > _YAML_CACHE_MAX:
+                _YAML_HASH_CACHE.popitem(last=False)
+    tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        encoded = json.dumps({"mtime_ns": mtime_ns, "size": size, "data": data}, ensure_ascii=False)
+        if json.loads(encoded)["data"] != data:
+            # 정수 키 등 JSON 왕복이 손실되면 캐시하지 않습니다./Skip lossy round-trips.
+            return data
+        tmp_path.write_text(encoded, encoding="utf-8")
+        os.replace(tmp_path, sidecar)
+    except (OSError, TypeError, ValueError):
+        # 읽기 전용 위치나 JSON 비호환 값은 캐시하지 않습니다./Skip caching on read-only dirs or non-JSON values.
+        tmp_path.unlink(missing_ok=True)
+    return data
+
+
+def read_yaml(path: Path) -> Any:
+    """mtime·크기 기준 LRU 캐시로 YAML을 읽습니다./Read YAML through an mtime/size LRU cache."""
+
+    key = str(path.resolve())
+    stat = path.stat()
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _YAML_CACHE.move_to_end(key)
+            return copy.deepcopy(cached[2])
+    data = _load_yaml_with_sidecar(path, stat.st_mtime_ns, stat.st_size)
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+        _YAML_CACHE.move_to_end(key)
+        while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
 
 
 def write_json(path: Path, payload: Any) -> None:
     """JSON 파일을 저장합니다./Persist payload to JSON file."""
 
     ensure_directory(path.parent)
+    if orjson is not None:
+        # 들여쓰기 출력도 C 인코더로 한 번에 직렬화합니다./Serialize indented output in C.
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        path.write_bytes(orjson.dumps(payload, option=option))
+        return
     with path.open("w", encoding="utf-8") as handle:
         json.dump(payload, handle, ensure_ascii=False, indent=2)
 